@@ -1,6 +1,6 @@
 """
 POD Categorization module for Zendesk Ticket Summarizer (Phase 2).
-Categorizes synthesized tickets into PODs using Gemini LLM with confidence scoring.
+Categorizes synthesized tickets into PODs using an LLM (Gemini or Azure OpenAI) with confidence scoring.
 
 """
 
@@ -8,15 +8,15 @@ import asyncio
 import logging
 import re
 from typing import Dict, List, Optional, Callable
-from google import genai
 
 import config
 import utils
+from llm_provider import LLMProviderFactory
 
 
 class TicketCategorizer:
     """
-    Async ticket categorizer using Gemini LLM for POD assignment.
+    Async ticket categorizer using the configured LLM provider for POD assignment.
 
     This is Phase 3 of the ticket processing workflow. It takes the synthesis
     output from Phase 2 and determines which POD (Product Organizational Domain)
@@ -30,27 +30,35 @@ class TicketCategorizer:
     - Comprehensive validation and error handling
     """
 
-    def __init__(self):
+    def __init__(self, model_provider: str = "gemini"):
         """
-        Initialize the categorizer with Gemini model and rate limiting.
+        Initialize the categorizer with the configured LLM provider and rate limiting.
 
         Sets up:
         - Logger for tracking categorization operations
-        - Gemini client (new google-genai SDK)
+        - Shared provider client (via LLMProviderFactory)
         - Rate limiting semaphore (5 concurrent max)
-        - Model name configuration
+
+        Args:
+            model_provider: LLM provider name ("gemini" or "azure")
+                           Defaults to "gemini" for backward compatibility
+
+        Raises:
+            ValueError: If provider credentials are missing or invalid
         """
         self.logger = logging.getLogger("ticket_summarizer.categorizer")
+        self.model_provider = model_provider
 
-        # Initialize new unified Google GenAI client
-        self.client = genai.Client(api_key=config.GEMINI_API_KEY)
-        self.model_name = config.GEMINI_MODEL
+        # Reuse the process-wide provider client (memoized by the factory), so
+        # categorization shares its connection pool, rate limiter and response cache
+        # with the synthesis and diagnostics phases of the same run
+        self.client = LLMProviderFactory.get_provider(model_provider)
 
-        # Rate limiting: Max 5 concurrent Gemini API calls
+        # Rate limiting: Max 5 concurrent LLM API calls
         # Prevents hitting API rate limits while maintaining good throughput
         self.semaphore = asyncio.Semaphore(config.GEMINI_MAX_CONCURRENT)
 
-        self.logger.info(f"Initialized Categorizer with model: {self.model_name}")
+        self.logger.info(f"Initialized Categorizer with {model_provider} provider")
 
     def format_categorization_prompt(self, ticket_data: Dict) -> str:
         """
@@ -107,7 +115,7 @@ class TicketCategorizer:
         Handles missing or malformed fields gracefully with fallbacks.
 
         Args:
-            response_text: Raw text response from Gemini LLM
+            response_text: Raw text response from the LLM
 
         Returns:
             Dictionary with categorization fields:
@@ -234,7 +242,7 @@ class TicketCategorizer:
 
         except Exception as e:
             self.logger.error(f"Error parsing categorization response: {e}")
-            self.logger.debug(f"Raw response: {response_text[:500]}...")
+            self.logger.debug("Raw response: %.500s...", response_text)
 
         return categorization
 
@@ -246,7 +254,7 @@ class TicketCategorizer:
         This is the core categorization method. It:
         1. Extracts synthesis from ticket data
         2. Formats categorization prompt with POD definitions
-        3. Calls Gemini LLM for categorization decision
+        3. Calls the LLM for categorization decision
         4. Parses and validates the response
         5. Returns ticket data with categorization added
 
@@ -272,10 +280,10 @@ class TicketCategorizer:
         """
         ticket_id = ticket_data.get('ticket_id', 'unknown')
 
-        # Rate limiting: Ensure we don't exceed Gemini API limits
+        # Rate limiting: Ensure we don't exceed provider API limits
         # Only 5 categorizations can run concurrently
         async with self.semaphore:
-            self.logger.debug(f"Categorizing ticket {ticket_id}")
+            self.logger.debug("Categorizing ticket %s", ticket_id)
 
             try:
                 # Step 1: Extract synthesis data for categorization
@@ -291,29 +299,26 @@ class TicketCategorizer:
                 # Prompt includes all POD definitions and categorization logic
                 prompt = self.format_categorization_prompt(ticket_data)
 
-                # Step 3: Call Gemini LLM for categorization (new google-genai SDK)
-                # Run synchronous API call in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.models.generate_content(
-                        model=self.model_name,
-                        contents=prompt
-                    )
-                )
+                # Step 3: Call LLM for categorization (native async - no executor thread)
+                response = await self.client.generate_content_async(prompt)
 
                 # Validate response
                 if not response or not response.text:
                     raise utils.GeminiAPIError(
-                        f"Empty response from Gemini for ticket {ticket_id}"
+                        f"Empty response from LLM for ticket {ticket_id}"
                     )
 
                 response_text = response.text
-                self.logger.debug(f"Received categorization response for ticket {ticket_id}")
+                self.logger.debug("Received categorization response for ticket %s", ticket_id)
 
                 # Step 4: Parse LLM response into structured categorization data
                 categorization = self.parse_categorization_response(response_text)
 
+                # Only a fully parsed response is worth replaying from the cache
+                if (categorization["primary_pod"] and categorization["reasoning"]
+                        and categorization["confidence_reason"]):
+                    self.client.cache_response(prompt, response)
+
                 # Step 5: Add categorization to ticket data
                 result = ticket_data.copy()
                 result["categorization"] = categorization
@@ -324,10 +329,6 @@ class TicketCategorizer:
                     f"(confidence: {categorization['confidence']})"
                 )
 
-                # Add delay to respect free tier rate limits
-                if config.GEMINI_REQUEST_DELAY > 0:
-                    await asyncio.sleep(config.GEMINI_REQUEST_DELAY)
-
                 return result
 
             except Exception as e:
@@ -25,6 +25,9 @@ if not ZENDESK_API_KEY:
 ZENDESK_BASE_URL = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2"
 ZENDESK_TICKET_URL = f"{ZENDESK_BASE_URL}/tickets/{{ticket_id}}.json"
 ZENDESK_COMMENTS_URL = f"{ZENDESK_BASE_URL}/tickets/{{ticket_id}}/comments.json"
+ZENDESK_SHOW_MANY_URL = f"{ZENDESK_BASE_URL}/tickets/show_many.json?ids={{ticket_ids}}"
+ZENDESK_SHOW_MANY_BATCH_SIZE = 100  # Zendesk show_many accepts at most 100 IDs per request
+ZENDESK_COMMENT_PREFETCH_PAGES = 3    # Max comment pages fetched concurrently per ticket
 
 # Zendesk Custom Field IDs
 DIAGNOSTICS_CUSTOM_FIELD_ID = 41001255923353  # "Was Diagnostic Panel used?" field
@@ -79,8 +82,38 @@ DEFAULT_MODEL_PROVIDER = "gemini"
 ZENDESK_MAX_CONCURRENT = 10  # Conservative for Enterprise plan
 GEMINI_MAX_CONCURRENT = 1    # Sequential for free tier (10 req/min limit)
 
-# Request delay configuration
-GEMINI_REQUEST_DELAY = 7     # Seconds between Gemini API calls (keeps under 10/min)
+# Adaptive concurrency (AIMD) for Diagnostics analysis LLM calls
+# Starts at GEMINI_MAX_CONCURRENT, grows additively on success up to the ceiling,
+# and halves on rate-limit (429 / RESOURCE_EXHAUSTED) errors
+LLM_ADAPTIVE_CONCURRENCY_CEILING = 5
+LLM_ADAPTIVE_INCREASE_STEP = 0.1
+LLM_ADAPTIVE_DECREASE_FACTOR = 0.5
+LLM_DEFAULT_RETRY_AFTER_SECONDS = 30   # Pause after a rate-limit error that names no retry delay
+
+# In-process LRU of LLM responses keyed by prompt content hash (0 disables)
+LLM_RESPONSE_CACHE_SIZE = 512
+
+# Optional on-disk layer under the LRU, so re-running the same tickets skips identical LLM calls
+LLM_RESPONSE_CACHE_PERSIST = os.getenv("LLM_RESPONSE_CACHE_PERSIST", "false").lower() == "true"
+LLM_RESPONSE_CACHE_PATH = os.path.join(".cache", "llm_responses.sqlite3")
+LLM_RESPONSE_CACHE_TTL_SECONDS = 7 * 86400   # On-disk entries older than this are ignored and purged
+
+# Shared httpx connection pool for the Azure OpenAI SDK clients
+LLM_HTTP_MAX_CONNECTIONS = 32
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+LLM_HTTP_TIMEOUT_SECONDS = 60
+
+# Zendesk request rate (token bucket shared by all Zendesk requests)
+# Tightens when X-Rate-Limit-Remaining runs low and pauses for Retry-After on 429
+ZENDESK_RATE_LIMIT_PER_MINUTE = 700        # Zendesk Enterprise plan quota
+ZENDESK_RATE_LIMIT_LOW_WATERMARK = 50      # Start throttling below this many remaining
+ZENDESK_DEFAULT_RETRY_AFTER_SECONDS = 60   # Used when a 429 has no Retry-After header
+
+# Client-side request rate per LLM provider (token bucket in each client's async path;
+# replaces the old fixed per-request sleep)
+GEMINI_REQUESTS_PER_MINUTE = 10    # Free tier limit
+AZURE_REQUESTS_PER_MINUTE = 300    # Deployment RPM quota
+LLM_RATE_LIMIT_BURST = 1           # Token bucket capacity (no header feedback to bound a larger burst)
 
 # Retry configuration
 MAX_RETRIES = 1              # One retry attempt
@@ -89,6 +122,22 @@ RETRY_DELAY_SECONDS = 2      # Delay between retries
 # Timeout configuration
 REQUEST_TIMEOUT_SECONDS = 30
 
+# Zendesk connection pool configuration (persistent aiohttp session)
+ZENDESK_DNS_CACHE_TTL_SECONDS = 300      # Cache DNS lookups for the Zendesk host
+ZENDESK_KEEPALIVE_TIMEOUT_SECONDS = 30   # Keep idle connections open for reuse
+
+# Zendesk on-disk response cache (opt-in). Every entry is revalidated with a conditional
+# GET (ETag / Last-Modified); comments are reused without a request only while the
+# ticket's updated_at is unchanged
+ZENDESK_CACHE_ENABLED = os.getenv("ZENDESK_CACHE_ENABLED", "false").lower() == "true"
+ZENDESK_CACHE_PATH = os.path.join(".cache", "zendesk_responses.sqlite3")
+
+# Prompt caching configuration
+# TTL for Gemini explicit context caches holding static prompt prefixes
+GEMINI_PROMPT_CACHE_TTL_SECONDS = 3600
+# Recreate a context cache this long before its TTL lapses
+GEMINI_PROMPT_CACHE_REFRESH_MARGIN_SECONDS = 300
+
 # ============================================================================
 # LLM PROMPT TEMPLATE
 # ============================================================================
@@ -348,8 +397,12 @@ Provide your categorization in this EXACT format:
 # DIAGNOSTICS ANALYSIS CONFIGURATION (Phase 3b + Phase 6 Triage/Fix Enhancement)
 # ============================================================================
 
-# Diagnostics Analysis Prompt Template
-DIAGNOSTICS_ANALYSIS_PROMPT = """You are a Whatfix product expert analyzing support tickets to determine if the "Diagnostics" feature could have helped with the issue.
+# Diagnostics Analysis Prompt Template (Phase 3b), split for provider prompt caching.
+# The STATIC part (product knowledge, rules, output schema, examples) is identical for every
+# ticket and is sent first so providers can cache it (Gemini explicit context cache,
+# Azure OpenAI automatic prefix cache). It is NOT passed through str.format, so JSON braces are literal.
+# The DYNAMIC part holds the per-ticket placeholders and is appended after the static prefix.
+DIAGNOSTICS_ANALYSIS_PROMPT_STATIC = """You are a Whatfix product expert analyzing support tickets to determine if the "Diagnostics" feature could have helped with the issue.
 
 ## WHAT IS DIAGNOSTICS?
 
@@ -474,24 +527,6 @@ You MUST evaluate TWO dimensions SEPARATELY:
 
 ---
 
-## TICKET DATA
-
-**Subject:** {subject}
-**Issue Reported (LLM-inferred):** {issue_reported}
-**Root Cause (LLM-inferred):** {root_cause}
-**Summary:** {summary}
-**Resolution:** {resolution}
-**Custom Field (was_diagnostics_used):** {custom_field_value}
-
-**Support Agent's Root Cause (from Zendesk field):** {support_root_cause}
-_Note: Use this to validate/enrich your analysis. If it differs from LLM-inferred root cause, acknowledge both._
-
-**ESCALATION STATUS:**
-- **Escalated to Engineering:** {is_escalated}
-- **JIRA Ticket ID:** {jira_ticket_id}
-
----
-
 ## ANALYSIS LOGIC
 
 ### Step 1: Was Diagnostics Used?
@@ -525,13 +560,13 @@ _Note: Use this to validate/enrich your analysis. If it differs from LLM-inferre
 Provide your analysis in this EXACT JSON structure:
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "yes|no|unknown",
     "confidence": "confident|not confident",
     "reasoning": "Explain based on synthesis evidence"
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "yes|no|maybe",
     "triage_reasoning": "Why Diagnostics could/couldn't help IDENTIFY the issue. Reference specific detection capabilities.",
     "triage_gap_area": "One of the values below OR null if triage_assessment is yes",
@@ -543,11 +578,11 @@ Provide your analysis in this EXACT JSON structure:
     "confidence": "confident|not confident",
     "diagnostics_capability_matched": ["capability 1", "capability 2"] or [],
     "limitation_notes": "Explain specific limitations that apply" or null
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "troubleshooting|feature_request|technical_request|unclear"
-  }}
-}}
+  }
+}
 ```
 
 ---
@@ -607,13 +642,13 @@ Root Cause: Missing selector for step
 Support Root Cause: "Element detection failure - added unique CSS selector"
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "no",
     "confidence": "confident",
     "reasoning": "Synthesis shows manual troubleshooting by support team without mention of Diagnostics."
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "yes",
     "triage_reasoning": "Diagnostics would show step 7 failing due to element detection failure, helping author understand WHAT is failing before contacting support.",
     "triage_gap_area": null,
@@ -625,11 +660,11 @@ Support Root Cause: "Element detection failure - added unique CSS selector"
     "confidence": "confident",
     "diagnostics_capability_matched": ["Element detection failures", "Step execution status"],
     "limitation_notes": "Diagnostics cannot construct CSS selectors; this requires technical expertise from support team."
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "troubleshooting"
-  }}
-}}
+  }
+}
 ```
 
 **Example 2: Reselection Fix (triage=yes, fix=yes)**
@@ -640,13 +675,13 @@ Root Cause: Page DOM changed, original selection invalid
 Support Root Cause: "DOM change broke element selection"
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "no",
     "confidence": "confident",
     "reasoning": "No mention of Diagnostics in synthesis. Issue resolved through reselection."
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "yes",
     "triage_reasoning": "Diagnostics would show element not found, indicating the original selection is no longer valid.",
     "triage_gap_area": null,
@@ -658,11 +693,11 @@ Support Root Cause: "DOM change broke element selection"
     "confidence": "confident",
     "diagnostics_capability_matched": ["Element detection failures", "Property mismatch detection"],
     "limitation_notes": null
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "troubleshooting"
-  }}
-}}
+  }
+}
 ```
 
 **Example 3: Use Case Implementation (triage=no, fix=no)**
@@ -673,13 +708,13 @@ Root Cause: Technical implementation request
 Support Root Cause: "Customer needed new window variable setup"
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "no",
     "confidence": "confident",
     "reasoning": "This was a use case implementation request, not a troubleshooting scenario."
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "no",
     "triage_reasoning": "This is a use case implementation request, not a troubleshooting scenario. No failure to diagnose - the author needed help building something new.",
     "triage_gap_area": "use_case_implementation",
@@ -691,11 +726,11 @@ Support Root Cause: "Customer needed new window variable setup"
     "confidence": "confident",
     "diagnostics_capability_matched": [],
     "limitation_notes": "Use case implementation requests are outside Diagnostics scope."
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "technical_request"
-  }}
-}}
+  }
+}
 ```
 
 **Example 4: Latching Issue (triage=maybe, fix=no)**
@@ -706,13 +741,13 @@ Root Cause: Non-unique DOM structure causing incorrect element match
 Support Root Cause: "Element latching to wrong target - added unique CSS selector"
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "no",
     "confidence": "confident",
     "reasoning": "No mention of Diagnostics. Issue identified through manual investigation."
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "maybe",
     "triage_reasoning": "Diagnostics would show 'element found' but CANNOT detect if it's the WRONG element. It provides partial visibility - author would see element found successfully, which is misleading for latching issues.",
     "triage_gap_area": "latching",
@@ -724,11 +759,11 @@ Support Root Cause: "Element latching to wrong target - added unique CSS selecto
     "confidence": "confident",
     "diagnostics_capability_matched": [],
     "limitation_notes": "Diagnostics cannot detect latching issues (wrong element found) - it only shows element found/not found status."
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "troubleshooting"
-  }}
-}}
+  }
+}
 ```
 
 **Example 5: Occurrence Exhausted (triage=yes, fix=yes)**
@@ -739,13 +774,13 @@ Root Cause: Occurrence count exhausted
 Support Root Cause: "Occurrence limit reached"
 
 ```json
-{{
-  "was_diagnostics_used": {{
+{
+  "was_diagnostics_used": {
     "llm_assessment": "no",
     "confidence": "confident",
     "reasoning": "No mention of Diagnostics. Support identified occurrence setting issue."
-  }},
-  "could_diagnostics_help": {{
+  },
+  "could_diagnostics_help": {
     "triage_assessment": "yes",
     "triage_reasoning": "Diagnostics shows occurrence exhausted status, which would have directly identified that the pop-up already reached its display limit.",
     "triage_gap_area": null,
@@ -757,13 +792,35 @@ Support Root Cause: "Occurrence limit reached"
     "confidence": "confident",
     "diagnostics_capability_matched": ["Occurrence exhausted detection", "Content status visibility"],
     "limitation_notes": null
-  }},
-  "metadata": {{
+  },
+  "metadata": {
     "ticket_type": "troubleshooting"
-  }}
-}}
+  }
+}
 ```
 
 ---
 
 Focus on accuracy. Only use information from the synthesis. When in doubt, use "maybe" with "not confident"."""
+
+DIAGNOSTICS_ANALYSIS_PROMPT_DYNAMIC = """
+
+---
+
+## TICKET DATA
+
+**Subject:** {subject}
+**Issue Reported (LLM-inferred):** {issue_reported}
+**Root Cause (LLM-inferred):** {root_cause}
+**Summary:** {summary}
+**Resolution:** {resolution}
+**Custom Field (was_diagnostics_used):** {custom_field_value}
+
+**Support Agent's Root Cause (from Zendesk field):** {support_root_cause}
+_Note: Use this to validate/enrich your analysis. If it differs from LLM-inferred root cause, acknowledge both._
+
+**ESCALATION STATUS:**
+- **Escalated to Engineering:** {is_escalated}
+- **JIRA Ticket ID:** {jira_ticket_id}
+
+Analyze the ticket above using the rules and output structure defined earlier."""
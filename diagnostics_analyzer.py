@@ -23,6 +23,43 @@ import utils
 from llm_provider import LLMProviderFactory
 
 
+# Phase 6: overall_assessment keyed by (triage_assessment, fix_assessment)
+# - triage=yes AND fix=yes → "yes" (full self-service possible)
+# - triage=yes AND fix=no/maybe → "maybe" (partial help - can identify but not fix)
+# - triage=maybe → "maybe"
+# - triage=no → "no"
+_OVERALL_ASSESSMENT = {
+    ("yes", "yes"): "yes",
+    ("yes", "no"): "maybe",
+    ("yes", "maybe"): "maybe",
+    ("maybe", "yes"): "maybe",
+    ("maybe", "no"): "maybe",
+    ("maybe", "maybe"): "maybe",
+    ("no", "yes"): "no",
+    ("no", "no"): "no",
+    ("no", "maybe"): "no",
+}
+
+# Top-level sections every diagnostics analysis must contain
+_REQUIRED_SECTIONS = ("was_diagnostics_used", "could_diagnostics_help", "metadata")
+
+_VALID_TICKET_TYPES = ("troubleshooting", "feature_request", "technical_request", "unclear")
+
+# Declarative field rules for _validate_analysis_structure: (section, field, check, warning)
+# Warnings use %(value)s / %(ticket_id)s so they are only formatted when emitted
+_FIELD_RULES = (
+    ("was_diagnostics_used", "llm_assessment", utils.validate_diagnostics_usage,
+     "Invalid llm_assessment '%(value)s' for ticket %(ticket_id)s. Expected: yes, no, or unknown"),
+    ("was_diagnostics_used", "confidence", utils.validate_confidence,
+     "Invalid confidence for was_diagnostics_used in ticket %(ticket_id)s"),
+    ("was_diagnostics_used", "reasoning", bool,
+     "Empty reasoning for was_diagnostics_used in ticket %(ticket_id)s"),
+    ("metadata", "ticket_type", _VALID_TICKET_TYPES.__contains__,
+     "Invalid ticket_type '%(value)s' for ticket %(ticket_id)s. "
+     f"Expected one of: {list(_VALID_TICKET_TYPES)}"),
+)
+
+
 class DiagnosticsAnalyzer:
     """
     Async Diagnostics analyzer using LLM provider abstraction.
@@ -47,14 +84,17 @@ class DiagnosticsAnalyzer:
         self.model_provider = model_provider
 
         # Initialize LLM provider using factory pattern
-        self.logger.info(f"Initializing Diagnostics analyzer with model provider: {model_provider}")
+        self.logger.info("Initializing Diagnostics analyzer with model provider: %s", model_provider)
         self.llm_client = LLMProviderFactory.get_provider(model_provider)
 
-        # Rate limiting: sequential processing for free tier
-        self.semaphore = asyncio.Semaphore(config.GEMINI_MAX_CONCURRENT)
-        self.request_delay = config.GEMINI_REQUEST_DELAY
+        # Rate limiting: adaptive concurrency starting at the free-tier limit,
+        # growing on success and backing off on rate-limit errors
+        self.limiter = utils.AdaptiveLimiter(
+            initial_limit=config.GEMINI_MAX_CONCURRENT,
+            ceiling=config.LLM_ADAPTIVE_CONCURRENCY_CEILING
+        )
 
-        self.logger.info(f"Diagnostics analyzer initialized with {model_provider} provider")
+        self.logger.info("Diagnostics analyzer initialized with %s provider", model_provider)
 
     async def analyze_ticket(self, ticket_data: Dict) -> Dict:
         """
@@ -71,127 +111,100 @@ class DiagnosticsAnalyzer:
         """
         ticket_id = ticket_data.get("ticket_id", "unknown")
 
-        async with self.semaphore:
-            self.logger.debug(f"Analyzing ticket {ticket_id} for Diagnostics applicability")
+        self.logger.debug("Analyzing ticket %s for Diagnostics applicability", ticket_id)
 
-            try:
-                # Extract synthesis data
-                synthesis = ticket_data.get("synthesis", {})
-                subject = ticket_data.get("subject", "No subject")
-                issue_reported = synthesis.get("issue_reported", "Not available")
-                root_cause = synthesis.get("root_cause", "Not available")
-                summary = synthesis.get("summary", "Not available")
-                resolution = synthesis.get("resolution", "Not available")
-
-                # Extract custom field value
-                custom_fields = ticket_data.get("custom_fields", {})
-                custom_field_value = custom_fields.get("was_diagnostics_used", "unknown")
-
-                # Extract escalation data (Phase 5)
-                escalation = custom_fields.get("escalation", {})
-                is_escalated = escalation.get("is_escalated", False)
-                jira_ticket_id = escalation.get("jira_ticket_id", "None")
-
-                # Extract support agent's root cause (Phase 6)
-                support_root_cause = custom_fields.get("support_root_cause", "Not provided")
-
-                # Format the prompt with ticket data
-                prompt = self._format_diagnostics_prompt(
-                    subject=subject,
-                    issue_reported=issue_reported,
-                    root_cause=root_cause,
-                    summary=summary,
-                    resolution=resolution,
-                    custom_field_value=custom_field_value,
-                    is_escalated=is_escalated,
-                    jira_ticket_id=jira_ticket_id,
-                    support_root_cause=support_root_cause
-                )
+        try:
+            # Extract synthesis data
+            synthesis = ticket_data.get("synthesis", {})
+            subject = ticket_data.get("subject", "No subject")
+            issue_reported = synthesis.get("issue_reported", "Not available")
+            root_cause = synthesis.get("root_cause", "Not available")
+            summary = synthesis.get("summary", "Not available")
+            resolution = synthesis.get("resolution", "Not available")
+
+            # Extract custom field value
+            custom_fields = ticket_data.get("custom_fields", {})
+            custom_field_value = custom_fields.get("was_diagnostics_used", "unknown")
+
+            # Extract escalation data (Phase 5)
+            escalation = custom_fields.get("escalation", {})
+            is_escalated = escalation.get("is_escalated", False)
+            jira_ticket_id = escalation.get("jira_ticket_id", "None")
+
+            # Extract support agent's root cause (Phase 6)
+            support_root_cause = custom_fields.get("support_root_cause", "Not provided")
+
+            # Format the per-ticket part of the prompt (single template fill, no intermediate helper)
+            # The static prefix is sent separately so providers can cache it
+            prompt = config.DIAGNOSTICS_ANALYSIS_PROMPT_DYNAMIC.format(
+                subject=subject,
+                issue_reported=issue_reported,
+                root_cause=root_cause,
+                summary=summary,
+                resolution=resolution,
+                custom_field_value=custom_field_value,
+                is_escalated=is_escalated,
+                jira_ticket_id=jira_ticket_id,
+                support_root_cause=support_root_cause
+            )
 
-                # Call LLM API (via provider abstraction)
-                self.logger.debug(f"Calling LLM API for ticket {ticket_id}")
-                response = await asyncio.to_thread(
-                    self.llm_client.generate_content, prompt
+            # Call LLM API (via provider abstraction, native async - no executor thread)
+            self.logger.debug("Calling LLM API for ticket %s", ticket_id)
+            # Hold the adaptive slot only for the API call itself, so additive
+            # increase tracks backend capacity rather than local parsing work
+            async with self.limiter.slot():
+                response = await self.llm_client.generate_content_async(
+                    prompt, static_prefix=config.DIAGNOSTICS_ANALYSIS_PROMPT_STATIC
                 )
+            self.limiter.record_success()
 
-                # Parse response
-                analysis_result = self._parse_diagnostics_response(response.text, ticket_id)
+            # Parse response
+            analysis_result = self._parse_diagnostics_response(response.text, ticket_id)
 
-                # Add custom field value and derived overall assessment to the result
-                if analysis_result:
-                    analysis_result["was_diagnostics_used"]["custom_field_value"] = custom_field_value
-                    analysis_result["metadata"]["analysis_timestamp"] = utils.get_current_ist_timestamp()
-
-                    # Phase 6: Derive overall_assessment from triage + fix
-                    could_help = analysis_result.get("could_diagnostics_help", {})
-                    triage = could_help.get("triage_assessment", "maybe")
-                    fix = could_help.get("fix_assessment", "no")
-                    overall = self._derive_overall_assessment(triage, fix)
-                    analysis_result["could_diagnostics_help"]["overall_assessment"] = overall
-
-                    # Generate overall_reasoning
-                    if overall == "yes":
-                        overall_reasoning = "Diagnostics could both identify and help fix the issue."
-                    elif overall == "maybe":
-                        if triage == "yes":
-                            overall_reasoning = "Diagnostics could help identify the issue but not resolve it."
-                        else:
-                            overall_reasoning = "Partial help possible - details uncertain."
+            # Add custom field value and derived overall assessment to the result
+            if analysis_result:
+                self.llm_client.cache_response(
+                    prompt, response, static_prefix=config.DIAGNOSTICS_ANALYSIS_PROMPT_STATIC
+                )
+                analysis_result["was_diagnostics_used"]["custom_field_value"] = custom_field_value
+                analysis_result["metadata"]["analysis_timestamp"] = utils.get_current_ist_timestamp()
+
+                # Phase 6: Derive overall_assessment from triage + fix
+                # (assessments were already normalized to lowercase during validation)
+                could_help = analysis_result["could_diagnostics_help"]
+                triage = could_help["triage_assessment"]
+                fix = could_help["fix_assessment"]
+                overall = self._derive_overall_assessment(triage, fix)
+                could_help["overall_assessment"] = overall
+
+                # Generate overall_reasoning
+                if overall == "yes":
+                    overall_reasoning = "Diagnostics could both identify and help fix the issue."
+                elif overall == "maybe":
+                    if triage == "yes":
+                        overall_reasoning = "Diagnostics could help identify the issue but not resolve it."
                     else:
-                        overall_reasoning = "Diagnostics could not help with this issue."
-                    analysis_result["could_diagnostics_help"]["overall_reasoning"] = overall_reasoning
-
-                self.logger.info(f"Successfully analyzed ticket {ticket_id}")
-
-                # Add rate limiting delay
-                await asyncio.sleep(self.request_delay)
+                        overall_reasoning = "Partial help possible - details uncertain."
+                else:
+                    overall_reasoning = "Diagnostics could not help with this issue."
+                could_help["overall_reasoning"] = overall_reasoning
 
-                return analysis_result
+            self.logger.info("Successfully analyzed ticket %s", ticket_id)
 
-            except Exception as e:
-                self.logger.error(f"Failed to analyze ticket {ticket_id}: {e}")
-                raise utils.GeminiAPIError(f"Diagnostics analysis failed for ticket {ticket_id}: {e}")
-
-    def _format_diagnostics_prompt(
-        self,
-        subject: str,
-        issue_reported: str,
-        root_cause: str,
-        summary: str,
-        resolution: str,
-        custom_field_value: str,
-        is_escalated: bool,
-        jira_ticket_id: str,
-        support_root_cause: str = "Not provided"
-    ) -> str:
-        """
-        Format the Diagnostics analysis prompt with ticket data.
-
-        Args:
-            subject: Ticket subject
-            issue_reported: Issue reported from synthesis
-            root_cause: Root cause from synthesis (LLM-inferred)
-            summary: Summary from synthesis
-            resolution: Resolution from synthesis
-            custom_field_value: Normalized custom field value
-            is_escalated: Whether ticket was escalated to Engineering (Phase 5)
-            jira_ticket_id: JIRA ticket ID if escalated (Phase 5)
-            support_root_cause: Support agent's root cause from Zendesk field (Phase 6)
+            return analysis_result
 
-        Returns:
-            Formatted prompt string
-        """
-        return config.DIAGNOSTICS_ANALYSIS_PROMPT.format(
-            subject=subject,
-            issue_reported=issue_reported,
-            root_cause=root_cause,
-            summary=summary,
-            resolution=resolution,
-            custom_field_value=custom_field_value,
-            is_escalated=is_escalated,
-            jira_ticket_id=jira_ticket_id,
-            support_root_cause=support_root_cause
-        )
+        except Exception as e:
+            retry_after = None
+            if utils.is_rate_limit_error(e):
+                # Shrink concurrency and pause every caller for the provider's retry delay
+                self.limiter.record_rate_limit()
+                retry_after = utils.rate_limit_retry_after(e)
+                self.llm_client.rate_limiter.observe(retry_after=retry_after)
+            self.logger.error("Failed to analyze ticket %s: %s", ticket_id, e)
+            raise utils.GeminiAPIError(
+                f"Diagnostics analysis failed for ticket {ticket_id}: {e}",
+                retry_after=retry_after
+            )
 
     def _parse_diagnostics_response(self, response_text: str, ticket_id: str) -> Optional[Dict]:
         """
@@ -200,7 +213,7 @@ class DiagnosticsAnalyzer:
         Phase 6 Update: The LLM now returns triage and fix assessments separately.
         The overall_assessment is derived programmatically after parsing.
 
-        Phase 7 Update: Gap areas are normalized before validation - invalid values
+        Phase 7 Update: Gap areas are normalized during validation - invalid values
         are auto-remapped to "other_*_gap" with original value preserved in description.
 
         Expected JSON structure:
@@ -222,261 +235,295 @@ class DiagnosticsAnalyzer:
             if json_match:
                 json_str = json_match.group(1)
             else:
-                # Try to find JSON object directly
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
+                # Try to find JSON object directly (first balanced {...} block)
+                json_str = self._extract_json_object(response_text)
+                if json_str is None:
                     raise ValueError("No JSON found in LLM response")
 
             # Parse JSON
             analysis_data = json.loads(json_str)
 
-            # Phase 7: Normalize gap areas before validation
-            # This auto-remaps invalid values to "other_*_gap" with original value in description
-            analysis_data = self._normalize_gap_areas(analysis_data, ticket_id)
-
-            # Validate required fields
+            # Validate top-level structure, was_diagnostics_used and metadata
             if not self._validate_analysis_structure(analysis_data, ticket_id):
                 return None
 
-            self.logger.debug(f"Successfully parsed diagnostics analysis for ticket {ticket_id}")
+            # Phase 7: Normalize gap areas and validate could_diagnostics_help in a single pass
+            # This auto-remaps invalid values to "other_*_gap" with original value in description
+            if not self._normalize_and_validate_could_help(
+                analysis_data["could_diagnostics_help"], ticket_id
+            ):
+                return None
+
+            self.logger.debug("Successfully parsed diagnostics analysis for ticket %s", ticket_id)
             return analysis_data
 
         except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON for ticket {ticket_id}: {e}")
-            self.logger.debug(f"Raw response: {response_text}")
+            self.logger.error("Failed to parse JSON for ticket %s: %s", ticket_id, e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Raw response: %s", response_text)
             return None
         except Exception as e:
-            self.logger.error(f"Failed to parse diagnostics response for ticket {ticket_id}: {e}")
+            self.logger.error("Failed to parse diagnostics response for ticket %s: %s", ticket_id, e)
             return None
 
-    def _normalize_gap_areas(self, analysis_data: Dict, ticket_id: str) -> Dict:
+    def _extract_json_object(self, text: str) -> Optional[str]:
         """
-        Normalize gap area values, auto-remapping invalid values to "other_*_gap".
-
-        Phase 7 Enhancement: Instead of failing validation on invalid gap areas,
-        this method preserves the LLM's intent by:
-        1. Remapping invalid triage_gap_area to "other_triage_gap"
-        2. Remapping invalid fix_gap_area to "other_fix_gap"
-        3. Storing the original invalid value in the corresponding description field
+        Extract the first complete JSON object from free-form LLM text.
 
-        This ensures:
-        - No data loss (original LLM value is preserved)
-        - Pivot tables remain clean (only valid taxonomy values in gap_area columns)
-        - PM can review "other" descriptions to evolve taxonomy over time
+        Walks forward from the first '{' counting brace depth in a single linear
+        pass. Braces inside JSON strings (including escaped quotes) are ignored,
+        so trailing prose or stray braces after the object don't affect the match.
 
         Args:
-            analysis_data: Parsed analysis dictionary from LLM
-            ticket_id: Ticket ID for logging
+            text: Raw response text that may contain a JSON object
 
         Returns:
-            Analysis data with normalized gap areas
+            The JSON object substring, or None if no balanced object is found
         """
-        could_help = analysis_data.get("could_diagnostics_help", {})
-
-        # Normalize triage_gap_area
-        triage_gap = could_help.get("triage_gap_area")
-        if triage_gap is not None and triage_gap not in config.TRIAGE_GAP_AREAS:
-            original_value = triage_gap
-            existing_description = could_help.get("triage_gap_description") or ""
-
-            # Build new description with original value
-            if existing_description:
-                new_description = f"[Auto-remapped from '{original_value}'] {existing_description}"
-            else:
-                new_description = f"[Auto-remapped from '{original_value}'] LLM suggested this gap area which is not in the predefined taxonomy."
-
-            could_help["triage_gap_area"] = "other_triage_gap"
-            could_help["triage_gap_description"] = new_description
+        start = text.find("{")
+        if start == -1:
+            return None
 
-            self.logger.warning(
-                f"Ticket {ticket_id}: Invalid triage_gap_area '{original_value}' auto-remapped to 'other_triage_gap'. "
-                f"Original value preserved in triage_gap_description."
-            )
+        depth = 0
+        in_string = False
+        escaped = False
+
+        for i in range(start, len(text)):
+            char = text[i]
+
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+
+        return None
+
+    def _remap_gap_area(
+        self,
+        could_help: Dict,
+        gap_field: str,
+        other_value: str,
+        original_value: str,
+        existing_description: Optional[str],
+        ticket_id: str
+    ) -> str:
+        """
+        Remap an invalid gap area to "other_*_gap", preserving the original value.
 
-        # Normalize fix_gap_area
-        fix_gap = could_help.get("fix_gap_area")
-        if fix_gap is not None and fix_gap not in config.FIX_GAP_AREAS:
-            original_value = fix_gap
-            existing_description = could_help.get("fix_gap_description") or ""
+        Args:
+            could_help: could_diagnostics_help dictionary (mutated in place)
+            gap_field: Gap area key ("triage_gap_area" or "fix_gap_area")
+            other_value: Fallback taxonomy value ("other_triage_gap" or "other_fix_gap")
+            original_value: Invalid gap area value returned by the LLM
+            existing_description: Current gap description, if any
+            ticket_id: Ticket ID for logging
 
-            # Build new description with original value
-            if existing_description:
-                new_description = f"[Auto-remapped from '{original_value}'] {existing_description}"
-            else:
-                new_description = f"[Auto-remapped from '{original_value}'] LLM suggested this gap area which is not in the predefined taxonomy."
+        Returns:
+            The new gap description containing the original value
+        """
+        description_field = gap_field.replace("_area", "_description")
 
-            could_help["fix_gap_area"] = "other_fix_gap"
-            could_help["fix_gap_description"] = new_description
+        # Build new description with original value
+        if existing_description:
+            new_description = f"[Auto-remapped from '{original_value}'] {existing_description}"
+        else:
+            new_description = f"[Auto-remapped from '{original_value}'] LLM suggested this gap area which is not in the predefined taxonomy."
 
-            self.logger.warning(
-                f"Ticket {ticket_id}: Invalid fix_gap_area '{original_value}' auto-remapped to 'other_fix_gap'. "
-                f"Original value preserved in fix_gap_description."
-            )
+        could_help[gap_field] = other_value
+        could_help[description_field] = new_description
 
-        # Update the analysis data
-        analysis_data["could_diagnostics_help"] = could_help
-        return analysis_data
+        self.logger.warning(
+            "Ticket %s: Invalid %s '%s' auto-remapped to '%s'. "
+            "Original value preserved in %s.",
+            ticket_id, gap_field, original_value, other_value, description_field
+        )
+        return new_description
 
-    def _validate_analysis_structure(self, analysis_data: Dict, ticket_id: str) -> bool:
+    def _normalize_and_validate_could_help(self, could_help: Dict, ticket_id: str) -> bool:
         """
-        Validate the structure and values of the diagnostics analysis.
+        Normalize gap areas and validate the could_diagnostics_help section in one pass.
 
-        Phase 6 Update: Now validates triage_assessment and fix_assessment instead of single assessment.
-        Phase 7 Update: Gap area validation is now a safety net - invalid values are normalized
-        to "other_*_gap" BEFORE this method is called (see _normalize_gap_areas).
+        Phase 6: Validates triage_assessment and fix_assessment (plus reasoning).
+        Phase 7: Instead of failing validation on invalid gap areas, preserves the
+        LLM's intent by remapping them to "other_triage_gap" / "other_fix_gap" and
+        storing the original value in the corresponding description field. This keeps
+        pivot tables clean while letting PM review "other" descriptions to evolve
+        the taxonomy over time.
 
-        Checks:
-        - Required fields exist
-        - Enum values are valid (yes/no/unknown, yes/no/maybe, confident/not confident)
-        - Reasoning fields are not empty
-        - Gap areas are present when assessment is "no" or "maybe"
-        - Gap area values are in the predefined taxonomy (safety check after normalization)
+        Each field is read exactly once into a local; the dictionary is only written
+        to when a gap area is remapped. Gap areas are only inspected when the
+        corresponding assessment is "no" or "maybe" (none are expected for "yes").
 
         Args:
-            analysis_data: Parsed analysis dictionary (already normalized)
+            could_help: could_diagnostics_help dictionary from the parsed analysis
             ticket_id: Ticket ID for logging
 
         Returns:
             True if valid, False otherwise
         """
         try:
-            # Check top-level structure
-            if "was_diagnostics_used" not in analysis_data:
-                self.logger.error(f"Missing 'was_diagnostics_used' in ticket {ticket_id}")
-                return False
-            if "could_diagnostics_help" not in analysis_data:
-                self.logger.error(f"Missing 'could_diagnostics_help' in ticket {ticket_id}")
-                return False
-            if "metadata" not in analysis_data:
-                self.logger.error(f"Missing 'metadata' in ticket {ticket_id}")
-                return False
-
-            # Validate was_diagnostics_used
-            was_used = analysis_data["was_diagnostics_used"]
-            llm_assessment = was_used.get("llm_assessment", "").strip().lower()
-
-            if not utils.validate_diagnostics_usage(llm_assessment):
-                self.logger.warning(
-                    f"Invalid llm_assessment '{llm_assessment}' for ticket {ticket_id}. "
-                    f"Expected: yes, no, or unknown"
-                )
-                return False
-
-            if not utils.validate_confidence(was_used.get("confidence", "")):
-                self.logger.warning(
-                    f"Invalid confidence for was_diagnostics_used in ticket {ticket_id}"
-                )
-                return False
-
-            if not was_used.get("reasoning"):
-                self.logger.warning(
-                    f"Empty reasoning for was_diagnostics_used in ticket {ticket_id}"
-                )
-                return False
-
-            # Validate could_diagnostics_help (Phase 6: triage + fix assessments)
-            could_help = analysis_data["could_diagnostics_help"]
+            triage_assessment = str(could_help.get("triage_assessment", "")).strip().lower()
+            fix_assessment = str(could_help.get("fix_assessment", "")).strip().lower()
 
             # Validate triage_assessment
-            triage_assessment = could_help.get("triage_assessment", "").strip().lower()
             if not utils.validate_diagnostics_assessment(triage_assessment):
                 self.logger.warning(
-                    f"Invalid triage_assessment '{triage_assessment}' for ticket {ticket_id}. "
-                    f"Expected: yes, no, or maybe"
+                    "Invalid triage_assessment '%s' for ticket %s. "
+                    "Expected: yes, no, or maybe",
+                    triage_assessment, ticket_id
                 )
                 return False
 
             if not could_help.get("triage_reasoning"):
                 self.logger.warning(
-                    f"Empty triage_reasoning for ticket {ticket_id}"
+                    "Empty triage_reasoning for ticket %s",
+                    ticket_id
                 )
                 return False
 
             # Validate fix_assessment
-            fix_assessment = could_help.get("fix_assessment", "").strip().lower()
             if not utils.validate_diagnostics_assessment(fix_assessment):
                 self.logger.warning(
-                    f"Invalid fix_assessment '{fix_assessment}' for ticket {ticket_id}. "
-                    f"Expected: yes, no, or maybe"
+                    "Invalid fix_assessment '%s' for ticket %s. "
+                    "Expected: yes, no, or maybe",
+                    fix_assessment, ticket_id
                 )
                 return False
 
             if not could_help.get("fix_reasoning"):
                 self.logger.warning(
-                    f"Empty fix_reasoning for ticket {ticket_id}"
+                    "Empty fix_reasoning for ticket %s",
+                    ticket_id
                 )
                 return False
 
-            # Phase 7: Validate triage_gap_area (required when triage_assessment != "yes")
-            if triage_assessment in ["no", "maybe"]:
+            # Store normalized assessments so downstream derivation can use them as-is
+            if could_help["triage_assessment"] != triage_assessment:
+                could_help["triage_assessment"] = triage_assessment
+            if could_help["fix_assessment"] != fix_assessment:
+                could_help["fix_assessment"] = fix_assessment
+
+            # Phase 7: Normalize + validate triage_gap_area (required when triage_assessment != "yes")
+            if triage_assessment in ("no", "maybe"):
                 triage_gap = could_help.get("triage_gap_area")
-                if not triage_gap:
-                    self.logger.warning(
-                        f"Missing triage_gap_area for ticket {ticket_id} "
-                        f"(required when triage_assessment={triage_assessment})"
+                triage_gap_description = could_help.get("triage_gap_description")
+
+                if triage_gap is not None and triage_gap not in config.TRIAGE_GAP_AREAS:
+                    triage_gap_description = self._remap_gap_area(
+                        could_help, "triage_gap_area", "other_triage_gap",
+                        triage_gap, triage_gap_description, ticket_id
                     )
-                    return False
-                if not utils.validate_triage_gap_area(triage_gap):
+                    triage_gap = "other_triage_gap"
+
+                if not triage_gap:
                     self.logger.warning(
-                        f"Invalid triage_gap_area '{triage_gap}' for ticket {ticket_id}. "
-                        f"Expected one of: {config.TRIAGE_GAP_AREAS}"
+                        "Missing triage_gap_area for ticket %s "
+                        "(required when triage_assessment=%s)",
+                        ticket_id, triage_assessment
                     )
                     return False
                 # If other_triage_gap, description is required
-                if triage_gap == "other_triage_gap" and not could_help.get("triage_gap_description"):
+                if triage_gap == "other_triage_gap" and not triage_gap_description:
                     self.logger.warning(
-                        f"Missing triage_gap_description for other_triage_gap in ticket {ticket_id}"
+                        "Missing triage_gap_description for other_triage_gap in ticket %s",
+                        ticket_id
                     )
                     return False
 
-            # Phase 7: Validate fix_gap_area (required when fix_assessment != "yes")
-            if fix_assessment in ["no", "maybe"]:
+            # Phase 7: Normalize + validate fix_gap_area (required when fix_assessment != "yes")
+            if fix_assessment in ("no", "maybe"):
                 fix_gap = could_help.get("fix_gap_area")
-                if not fix_gap:
-                    self.logger.warning(
-                        f"Missing fix_gap_area for ticket {ticket_id} "
-                        f"(required when fix_assessment={fix_assessment})"
+                fix_gap_description = could_help.get("fix_gap_description")
+
+                if fix_gap is not None and fix_gap not in config.FIX_GAP_AREAS:
+                    fix_gap_description = self._remap_gap_area(
+                        could_help, "fix_gap_area", "other_fix_gap",
+                        fix_gap, fix_gap_description, ticket_id
                     )
-                    return False
-                if not utils.validate_fix_gap_area(fix_gap):
+                    fix_gap = "other_fix_gap"
+
+                if not fix_gap:
                     self.logger.warning(
-                        f"Invalid fix_gap_area '{fix_gap}' for ticket {ticket_id}. "
-                        f"Expected one of: {config.FIX_GAP_AREAS}"
+                        "Missing fix_gap_area for ticket %s "
+                        "(required when fix_assessment=%s)",
+                        ticket_id, fix_assessment
                     )
                     return False
                 # If other_fix_gap, description is required
-                if fix_gap == "other_fix_gap" and not could_help.get("fix_gap_description"):
+                if fix_gap == "other_fix_gap" and not fix_gap_description:
                     self.logger.warning(
-                        f"Missing fix_gap_description for other_fix_gap in ticket {ticket_id}"
+                        "Missing fix_gap_description for other_fix_gap in ticket %s",
+                        ticket_id
                     )
                     return False
 
             # Validate confidence
             if not utils.validate_confidence(could_help.get("confidence", "")):
                 self.logger.warning(
-                    f"Invalid confidence for could_diagnostics_help in ticket {ticket_id}"
+                    "Invalid confidence for could_diagnostics_help in ticket %s",
+                    ticket_id
                 )
                 return False
 
-            # Validate metadata
-            metadata = analysis_data["metadata"]
-            ticket_type = metadata.get("ticket_type", "")
-            valid_types = ["troubleshooting", "feature_request", "technical_request", "unclear"]
+            return True
 
-            if ticket_type not in valid_types:
-                self.logger.warning(
-                    f"Invalid ticket_type '{ticket_type}' for ticket {ticket_id}. "
-                    f"Expected one of: {valid_types}"
-                )
-                return False
+        except Exception as e:
+            self.logger.error("Validation error for ticket %s: %s", ticket_id, e)
+            return False
+
+    def _validate_analysis_structure(self, analysis_data: Dict, ticket_id: str) -> bool:
+        """
+        Validate the structure and values of the diagnostics analysis.
+
+        Walks the declarative _REQUIRED_SECTIONS / _FIELD_RULES tables once,
+        returning on the first failure.
+
+        Checks:
+        - Required fields exist
+        - was_diagnostics_used values are valid (yes/no/unknown, confident/not confident)
+        - Reasoning is not empty
+        - metadata.ticket_type is a known type
+
+        The could_diagnostics_help section (triage/fix assessments and gap areas) is
+        normalized and validated separately by _normalize_and_validate_could_help.
+
+        Args:
+            analysis_data: Parsed analysis dictionary
+            ticket_id: Ticket ID for logging
+
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            # Check top-level structure
+            for section in _REQUIRED_SECTIONS:
+                if section not in analysis_data:
+                    self.logger.error("Missing '%s' in ticket %s", section, ticket_id)
+                    return False
+
+            # Check field values
+            for section, field, check, warning in _FIELD_RULES:
+                value = analysis_data[section].get(field, "")
+                if not check(value):
+                    self.logger.warning(warning, {"value": value, "ticket_id": ticket_id})
+                    return False
 
-            self.logger.debug(f"Validation passed for ticket {ticket_id}")
+            self.logger.debug("Validation passed for ticket %s", ticket_id)
             return True
 
         except Exception as e:
-            self.logger.error(f"Validation error for ticket {ticket_id}: {e}")
+            self.logger.error("Validation error for ticket %s: %s", ticket_id, e)
             return False
 
     def _derive_overall_assessment(self, triage: str, fix: str) -> str:
@@ -484,68 +531,44 @@ class DiagnosticsAnalyzer:
         Derive overall_assessment from triage and fix assessments.
 
         Phase 6: Programmatic derivation ensures consistency.
-
-        Logic:
-        - triage=yes AND fix=yes → "yes" (full self-service possible)
-        - triage=yes AND fix=no/maybe → "maybe" (partial help - can identify but not fix)
-        - triage=maybe → "maybe"
-        - triage=no → "no"
+        Uses the precomputed _OVERALL_ASSESSMENT table (see module top for logic).
 
         Args:
-            triage: Triage assessment ("yes", "no", or "maybe")
-            fix: Fix assessment ("yes", "no", or "maybe")
+            triage: Normalized triage assessment ("yes", "no", or "maybe")
+            fix: Normalized fix assessment ("yes", "no", or "maybe")
 
         Returns:
             Overall assessment ("yes", "no", or "maybe")
         """
-        triage = triage.strip().lower()
-        fix = fix.strip().lower()
-
-        if triage == "yes" and fix == "yes":
-            return "yes"
-        elif triage == "yes" and fix in ["no", "maybe"]:
-            return "maybe"  # Partial help - can identify but not fix
-        elif triage == "maybe":
-            return "maybe"
-        else:  # triage == "no"
-            return "no"
+        return _OVERALL_ASSESSMENT.get((triage, fix), "no")
 
-    async def analyze_multiple(
+    async def _analyze_with_progress(
         self,
-        tickets: List[Dict],
+        ticket: Dict,
         progress_callback: Optional[Callable] = None
-    ) -> List[Dict]:
+    ) -> Dict:
         """
-        Analyze multiple tickets for Diagnostics applicability.
+        Analyze one ticket, recording the outcome on the ticket dict.
 
         Args:
-            tickets: List of ticket dictionaries with synthesis data
+            ticket: Ticket dictionary with synthesis data
             progress_callback: Optional callback for progress updates
 
         Returns:
-            List of tickets with diagnostics analysis added
+            The same ticket dictionary with diagnostics analysis (or error) added
         """
-        self.logger.info(f"Starting Diagnostics analysis for {len(tickets)} tickets")
-        analyzed_tickets = []
+        ticket_id = ticket.get("ticket_id", "unknown")
 
-        for ticket in tickets:
-            ticket_id = ticket.get("ticket_id", "unknown")
-
-            # Skip tickets that failed synthesis
-            if ticket.get("processing_status") == "failed":
-                self.logger.warning(
-                    f"Skipping ticket {ticket_id} - synthesis failed"
-                )
-                ticket["diagnostics_analysis_status"] = "skipped"
-                ticket["diagnostics_analysis_error"] = "Synthesis failed"
-                analyzed_tickets.append(ticket)
-
-                if progress_callback:
-                    progress_callback(ticket_id, ticket)
-
-                continue
+        # Skip tickets that failed synthesis
+        if ticket.get("processing_status") == "failed":
+            self.logger.warning(
+                "Skipping ticket %s - synthesis failed",
+                ticket_id
+            )
+            ticket["diagnostics_analysis_status"] = "skipped"
+            ticket["diagnostics_analysis_error"] = "Synthesis failed"
 
-            # Analyze ticket
+        else:
             try:
                 analysis_result = await self.analyze_ticket(ticket)
 
@@ -556,24 +579,45 @@ class DiagnosticsAnalyzer:
                     ticket["diagnostics_analysis_status"] = "failed"
                     ticket["diagnostics_analysis_error"] = "Failed to parse LLM response"
 
-                analyzed_tickets.append(ticket)
-
-                if progress_callback:
-                    progress_callback(ticket_id, ticket)
-
             except Exception as e:
-                self.logger.error(f"Failed to analyze ticket {ticket_id}: {e}")
+                self.logger.error("Failed to analyze ticket %s: %s", ticket_id, e)
                 ticket["diagnostics_analysis_status"] = "failed"
                 ticket["diagnostics_analysis_error"] = str(e)
-                analyzed_tickets.append(ticket)
 
-                if progress_callback:
-                    progress_callback(ticket_id, ticket)
+        if progress_callback:
+            progress_callback(ticket_id, ticket)
 
-        self.logger.info(
-            f"Completed Diagnostics analysis: "
-            f"{len([t for t in analyzed_tickets if t.get('diagnostics_analysis_status') == 'success'])} succeeded, "
-            f"{len([t for t in analyzed_tickets if t.get('diagnostics_analysis_status') == 'failed'])} failed"
+        return ticket
+
+    async def analyze_multiple(
+        self,
+        tickets: List[Dict],
+        progress_callback: Optional[Callable] = None
+    ) -> List[Dict]:
+        """
+        Analyze multiple tickets for Diagnostics applicability.
+
+        All tickets are scheduled at once; the adaptive limiter in analyze_ticket()
+        decides how many LLM calls are actually in flight.
+
+        Args:
+            tickets: List of ticket dictionaries with synthesis data
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            List of tickets with diagnostics analysis added
+        """
+        self.logger.info("Starting Diagnostics analysis for %s tickets", len(tickets))
+
+        analyzed_tickets = await asyncio.gather(
+            *(self._analyze_with_progress(ticket, progress_callback) for ticket in tickets)
         )
 
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Completed Diagnostics analysis: %s succeeded, %s failed",
+                sum(1 for t in analyzed_tickets if t.get('diagnostics_analysis_status') == 'success'),
+                sum(1 for t in analyzed_tickets if t.get('diagnostics_analysis_status') == 'failed')
+            )
+
         return analyzed_tickets
@@ -5,12 +5,21 @@ Implements rate limiting, retry logic, and comprehensive error handling.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Callable
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Callable, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 import aiohttp
+import orjson
 from aiohttp import BasicAuth
 
 import config
 import utils
+from response_cache import ResponseCache, CachedResponse
+
+
+# Comment fields consumed by fetch_ticket_complete(); everything else (html_body,
+# plain_body, attachments, metadata) is dropped as soon as a page is decoded
+_COMMENT_FIELDS = ("id", "author_id", "created_at", "body", "public", "via")
 
 
 class ZendeskFetcher:
@@ -27,7 +36,167 @@ class ZendeskFetcher:
             password=config.ZENDESK_API_KEY
         )
         self.timeout = aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT_SECONDS)
-        self.semaphore = asyncio.Semaphore(config.ZENDESK_MAX_CONCURRENT)
+        self._ticket_url_prefix = f"https://{config.ZENDESK_SUBDOMAIN}.zendesk.com/agent/tickets/"
+
+        # Persistent HTTP session (lazily created inside the running event loop)
+        # Reuses pooled connections, DNS cache and TLS sessions across batches.
+        # Concurrency is capped by the session's TCPConnector limit (no separate semaphore).
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Request-rate limiter fed by Zendesk's rate-limit headers
+        self.rate_limiter = utils.TokenBucket(config.ZENDESK_RATE_LIMIT_PER_MINUTE)
+
+        # On-disk response cache for repeated runs over overlapping CSVs
+        self.cache = ResponseCache() if config.ZENDESK_CACHE_ENABLED else None
+
+        # Custom field ID → handler dispatch, built once instead of an if/elif chain per field
+        # (unset field IDs are left out)
+        self._field_handlers: Dict[int, Callable[[object], Tuple[str, object]]] = {
+            field_id: handler
+            for field_id, handler in (
+                (config.DIAGNOSTICS_CUSTOM_FIELD_ID, self._parse_diagnostics_field),
+                (config.CROSS_TEAM_FIELD_ID, self._parse_cross_team_field),
+                (config.JIRA_TICKET_FIELD_ID, self._parse_jira_ticket_field),
+                (config.ROOT_CAUSE_FIELD_ID, self._parse_root_cause_field),
+            )
+            if field_id is not None
+        }
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        aiohttp speaks HTTP/1.1 only, so concurrency comes from a pool of
+        keep-alive connections: each is opened (TCP + TLS) once and then reused
+        for the rest of the run. Auth and timeout are set on the session so they
+        aren't rebuilt for every request.
+
+        Returns:
+            Persistent aiohttp client session with a tuned TCP connector
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.ZENDESK_MAX_CONCURRENT,
+                limit_per_host=config.ZENDESK_MAX_CONCURRENT,
+                ttl_dns_cache=config.ZENDESK_DNS_CACHE_TTL_SECONDS,
+                use_dns_cache=True,
+                keepalive_timeout=config.ZENDESK_KEEPALIVE_TIMEOUT_SECONDS,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=self.auth,
+                timeout=self.timeout
+            )
+            self.logger.debug("Created persistent Zendesk HTTP session")
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session and its connection pool."""
+        try:
+            if self._session is not None and not self._session.closed:
+                # Shielded so a Ctrl-C during teardown still flushes keepalive sockets
+                await asyncio.shield(self._session.close())
+                self.logger.debug("Closed Zendesk HTTP session")
+        finally:
+            self._session = None
+
+            if self.cache is not None:
+                self.cache.close()
+                self.cache = None
+
+    @asynccontextmanager
+    async def _get(self, session: aiohttp.ClientSession, url: str, **kwargs):
+        """
+        Issue a rate-limited GET request whose connection is returned to the pool on exit.
+
+        Every request first takes a token from the shared rate limiter, and the
+        response's rate-limit headers are fed back into it.
+
+        Args:
+            session: aiohttp client session
+            url: Request URL
+            **kwargs: Extra request options (headers, ...)
+
+        Yields:
+            aiohttp client response
+
+        Raises:
+            ZendeskAPIError: On HTTP 429 (carries the Retry-After delay for retries)
+        """
+        await self.rate_limiter.acquire()
+        async with session.get(url, **kwargs) as response:
+            remaining = response.headers.get('X-Rate-Limit-Remaining')
+            retry_after = None
+            if response.status == 429:
+                retry_after = float(
+                    response.headers.get('Retry-After', config.ZENDESK_DEFAULT_RETRY_AFTER_SECONDS)
+                )
+            self.rate_limiter.observe(
+                remaining=int(remaining) if remaining and remaining.isdigit() else None,
+                retry_after=retry_after
+            )
+
+            if retry_after is not None:
+                raise utils.ZendeskAPIError(
+                    f"Zendesk rate limit exceeded for {url}: retry after {retry_after:.0f}s",
+                    retry_after=retry_after
+                )
+
+            yield response
+
+    def _load_cached_ticket(self, ticket_id: str) -> Tuple[Optional[CachedResponse], Optional[Dict]]:
+        """
+        Load a ticket from the response cache.
+
+        Args:
+            ticket_id: Zendesk ticket ID
+
+        Returns:
+            Tuple of (cache entry, decoded ticket data), or (None, None) if not cached
+        """
+        if self.cache is None:
+            return None, None
+
+        entry = self.cache.get(f"t:{ticket_id}")
+        if entry is None:
+            return None, None
+
+        return entry, orjson.loads(entry.body).get('ticket', {})
+
+    def _load_cached_comments(self, ticket_id: str, updated_at: Optional[str]) -> Optional[List[Dict]]:
+        """
+        Load a ticket's comments from the response cache without any request.
+
+        Cached pages are only trusted when they were fetched for the same ticket
+        updated_at (any new or edited comment bumps it).
+
+        Args:
+            ticket_id: Zendesk ticket ID
+            updated_at: Ticket updated_at from freshly fetched metadata
+
+        Returns:
+            List of comment dictionaries, or None if the cache can't answer
+        """
+        if self.cache is None or not updated_at:
+            return None
+
+        marker = self.cache.get(f"u:{ticket_id}")
+        if marker is None or marker.body.decode() != updated_at:
+            return None
+
+        comments = []
+        page = 0
+        while True:
+            entry = self.cache.get(f"c:{ticket_id}:{page}")
+            if entry is None:
+                return None
+            data = self._decode_comments_page(entry.body)
+            comments.extend(data.get('comments', []))
+            if not data.get('next_page'):
+                return comments
+            page += 1
 
     @utils.retry_on_failure()
     async def fetch_ticket(self, session: aiohttp.ClientSession, ticket_id: str) -> Dict:
@@ -45,38 +214,209 @@ class ZendeskFetcher:
             TicketNotFoundError: If ticket doesn't exist
             ZendeskAPIError: If API call fails
         """
-        async with self.semaphore:
-            # Include custom fields in the API request
-            url = f"{config.ZENDESK_TICKET_URL.format(ticket_id=ticket_id)}"
-            self.logger.debug(f"Fetching ticket {ticket_id} with custom fields from {url}")
-
-            try:
-                async with session.get(url, auth=self.auth, timeout=self.timeout) as response:
-                    if response.status == 404:
-                        raise utils.TicketNotFoundError(f"Ticket {ticket_id} not found")
-                    elif response.status != 200:
-                        error_text = await response.text()
-                        raise utils.ZendeskAPIError(
-                            f"Failed to fetch ticket {ticket_id}: "
-                            f"HTTP {response.status} - {error_text}"
-                        )
-
-                    data = await response.json()
-                    self.logger.debug(f"Successfully fetched ticket {ticket_id}")
-                    return data.get('ticket', {})
-
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                raise utils.ZendeskAPIError(f"Network error fetching ticket {ticket_id}: {e}")
+        # Include custom fields in the API request
+        url = f"{config.ZENDESK_TICKET_URL.format(ticket_id=ticket_id)}"
+
+        # Revalidate any cached copy with a conditional GET
+        cached, cached_ticket = self._load_cached_ticket(ticket_id)
+
+        self.logger.debug("Fetching ticket %s with custom fields from %s", ticket_id, url)
+
+        try:
+            async with self._get(
+                session, url, headers=ResponseCache.conditional_headers(cached)
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    self.cache.touch(f"t:{ticket_id}")
+                    self.logger.debug("Ticket %s not modified - using cached copy", ticket_id)
+                    return cached_ticket
+                elif response.status == 404:
+                    raise utils.TicketNotFoundError(f"Ticket {ticket_id} not found")
+                elif response.status != 200:
+                    error_text = await response.text()
+                    raise utils.ZendeskAPIError(
+                        f"Failed to fetch ticket {ticket_id}: "
+                        f"HTTP {response.status} - {error_text}"
+                    )
+
+                body = await response.read()
+                if self.cache is not None:
+                    self.cache.set(
+                        f"t:{ticket_id}",
+                        body,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+
+                data = orjson.loads(body)
+                self.logger.debug("Successfully fetched ticket %s", ticket_id)
+                return data.get('ticket', {})
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise utils.ZendeskAPIError(f"Network error fetching ticket {ticket_id}: {e}")
 
     @utils.retry_on_failure()
-    async def fetch_comments(self, session: aiohttp.ClientSession, ticket_id: str) -> List[Dict]:
+    async def fetch_tickets_batch(
+        self,
+        session: aiohttp.ClientSession,
+        ticket_ids: List[str]
+    ) -> Dict[str, Dict]:
+        """
+        Fetch metadata for up to 100 tickets in one request via Zendesk show_many.
+
+        Tickets that don't exist (or aren't accessible) are silently omitted by
+        Zendesk, so callers should treat missing IDs as "fetch individually".
+
+        Args:
+            session: aiohttp client session
+            ticket_ids: Zendesk ticket IDs (at most ZENDESK_SHOW_MANY_BATCH_SIZE)
+
+        Returns:
+            Dictionary mapping ticket ID (str) to raw ticket data
+
+        Raises:
+            ZendeskAPIError: If API call fails
+        """
+        url = config.ZENDESK_SHOW_MANY_URL.format(ticket_ids=",".join(ticket_ids))
+        self.logger.debug("Fetching %s tickets via show_many", len(ticket_ids))
+
+        try:
+            async with self._get(session, url) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise utils.ZendeskAPIError(
+                        f"Failed to fetch ticket batch: HTTP {response.status} - {error_text}"
+                    )
+
+                data = orjson.loads(await response.read())
+                tickets = {str(t.get('id')): t for t in data.get('tickets', [])}
+                self.logger.debug("show_many returned %s/%s tickets", len(tickets), len(ticket_ids))
+                return tickets
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise utils.ZendeskAPIError(f"Network error fetching ticket batch: {e}")
+
+    @utils.retry_on_failure()
+    async def _fetch_comments_page(
+        self,
+        session: aiohttp.ClientSession,
+        ticket_id: str,
+        url: str,
+        page: int
+    ) -> Dict:
+        """
+        Fetch and decode a single page of ticket comments (with conditional GET).
+
+        Args:
+            session: aiohttp client session
+            ticket_id: Zendesk ticket ID
+            url: Page URL
+            page: Zero-based page index (used as the cache key)
+
+        Returns:
+            Decoded page data (comments trimmed to _COMMENT_FIELDS, next_page, count)
+
+        Raises:
+            ZendeskAPIError: If API call fails
+        """
+        cache_key = f"c:{ticket_id}:{page}"
+        cached = self.cache.get(cache_key) if self.cache is not None else None
+
+        async with self._get(
+            session, url, headers=ResponseCache.conditional_headers(cached)
+        ) as response:
+            if response.status == 304 and cached is not None:
+                # Page unchanged since last run - reuse cached body
+                self.cache.touch(cache_key)
+                body = cached.body
+            elif response.status != 200:
+                error_text = await response.text()
+                raise utils.ZendeskAPIError(
+                    f"Failed to fetch comments for ticket {ticket_id}: "
+                    f"HTTP {response.status} - {error_text}"
+                )
+            else:
+                body = await response.read()
+                if self.cache is not None:
+                    self.cache.set(
+                        cache_key,
+                        body,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
+
+        return self._decode_comments_page(body)
+
+    @staticmethod
+    def _decode_comments_page(body: bytes) -> Dict:
+        """
+        Decode a comments page body, trimming each comment to _COMMENT_FIELDS.
+
+        Args:
+            body: Raw response body
+
+        Returns:
+            Decoded page data
+        """
+        data = orjson.loads(body)
+        data['comments'] = [
+            {field: comment[field] for field in _COMMENT_FIELDS if field in comment}
+            for comment in data.get('comments', [])
+        ]
+        return data
+
+    def _remaining_page_urls(self, first_page: Dict) -> Optional[List[str]]:
+        """
+        Derive the URLs of all remaining comment pages from the first page.
+
+        Zendesk offset pagination returns the total comment count and a next_page
+        URL carrying a page query parameter, so every later page URL is known up
+        front and the pages can be fetched concurrently.
+
+        Args:
+            first_page: Decoded first page of comments
+
+        Returns:
+            List of URLs for pages 2..N, or None if they can't be derived
+            (caller falls back to following next_page serially)
+        """
+        next_page = first_page.get('next_page')
+        count = first_page.get('count')
+        per_page = len(first_page.get('comments', []))
+        if not next_page or not count or not per_page:
+            return None
+
+        parts = urlsplit(next_page)
+        query = parse_qs(parts.query)
+        if 'page' not in query:
+            return None
+
+        total_pages = -(-count // per_page)
+        urls = []
+        for page_number in range(2, total_pages + 1):
+            query['page'] = [str(page_number)]
+            urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+        return urls
+
+    async def fetch_comments(
+        self,
+        session: aiohttp.ClientSession,
+        ticket_id: str,
+        updated_at: Optional[str] = None
+    ) -> List[Dict]:
         """
         Fetch all comments for a ticket from Zendesk.
         Handles pagination to retrieve all comments.
 
+        After the first page, the remaining pages are fetched concurrently (at most
+        ZENDESK_COMMENT_PREFETCH_PAGES in flight) instead of walking next_page one
+        request at a time.
+
         Args:
             session: aiohttp client session
             ticket_id: Zendesk ticket ID
+            updated_at: Ticket updated_at, when the metadata was fetched first. Cached
+                        comments for the same updated_at are reused without a request.
 
         Returns:
             List of comment dictionaries
@@ -84,44 +424,71 @@ class ZendeskFetcher:
         Raises:
             ZendeskAPIError: If API call fails
         """
-        async with self.semaphore:
-            url = config.ZENDESK_COMMENTS_URL.format(ticket_id=ticket_id)
-            self.logger.debug(f"Fetching comments for ticket {ticket_id}")
+        cached_comments = self._load_cached_comments(ticket_id, updated_at)
+        if cached_comments is not None:
+            self.logger.debug("Ticket %s unchanged - using cached comments", ticket_id)
+            return cached_comments
 
-            all_comments = []
+        url = config.ZENDESK_COMMENTS_URL.format(ticket_id=ticket_id)
+        self.logger.debug("Fetching comments for ticket %s", ticket_id)
 
-            try:
+        try:
+            data = await self._fetch_comments_page(session, ticket_id, url, 0)
+            all_comments = list(data.get('comments', []))
+
+            page_urls = self._remaining_page_urls(data)
+            if page_urls:
+                # Bounded prefetch of the remaining pages, kept in page order
+                prefetch = asyncio.Semaphore(config.ZENDESK_COMMENT_PREFETCH_PAGES)
+
+                async def fetch_page(page_url: str, page: int) -> Dict:
+                    async with prefetch:
+                        return await self._fetch_comments_page(session, ticket_id, page_url, page)
+
+                tasks = [
+                    asyncio.ensure_future(fetch_page(page_url, page))
+                    for page, page_url in enumerate(page_urls, start=1)
+                ]
+                try:
+                    pages = await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+
+                for page_data in pages:
+                    all_comments.extend(page_data.get('comments', []))
+            else:
+                # Pagination can't be derived up front - follow next_page serially
+                url = data.get('next_page')
+                page = 1
                 while url:
-                    async with session.get(url, auth=self.auth, timeout=self.timeout) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            raise utils.ZendeskAPIError(
-                                f"Failed to fetch comments for ticket {ticket_id}: "
-                                f"HTTP {response.status} - {error_text}"
-                            )
-
-                        data = await response.json()
-                        comments = data.get('comments', [])
-                        all_comments.extend(comments)
-
-                        # Check for pagination
-                        url = data.get('next_page')
-
-                self.logger.debug(
-                    f"Successfully fetched {len(all_comments)} comments for ticket {ticket_id}"
-                )
-                return all_comments
+                    data = await self._fetch_comments_page(session, ticket_id, url, page)
+                    all_comments.extend(data.get('comments', []))
+                    url = data.get('next_page')
+                    page += 1
+
+            # Every page is cached now - record which ticket version they belong to
+            if self.cache is not None and updated_at:
+                self.cache.set(f"u:{ticket_id}", updated_at.encode())
+
+            self.logger.debug(
+                "Successfully fetched %s comments for ticket %s",
+                len(all_comments), ticket_id
+            )
+            return all_comments
 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                raise utils.ZendeskAPIError(
-                    f"Network error fetching comments for ticket {ticket_id}: {e}"
-                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise utils.ZendeskAPIError(
+                f"Network error fetching comments for ticket {ticket_id}: {e}"
+            )
 
     async def fetch_ticket_complete(
         self,
         session: aiohttp.ClientSession,
         ticket_id: str,
-        serial_no: Optional[int] = None
+        serial_no: Optional[int] = None,
+        ticket_data: Optional[Dict] = None
     ) -> Dict:
         """
         Fetch complete ticket data including metadata and all comments.
@@ -130,23 +497,46 @@ class ZendeskFetcher:
             session: aiohttp client session
             ticket_id: Zendesk ticket ID
             serial_no: Optional serial number from CSV
+            ticket_data: Raw ticket metadata already fetched via show_many.
+                         When provided, only the comments are requested.
 
         Returns:
             Dictionary containing complete ticket data with comments
         """
         try:
-            # Fetch ticket and comments in parallel
-            ticket_data, comments_data = await asyncio.gather(
-                self.fetch_ticket(session, ticket_id),
-                self.fetch_comments(session, ticket_id),
-                return_exceptions=True
-            )
-
-            # Handle exceptions from parallel fetch
-            if isinstance(ticket_data, Exception):
-                raise ticket_data
-            if isinstance(comments_data, Exception):
-                raise comments_data
+            if ticket_data is not None:
+                # Metadata came from a show_many batch - one request for comments only
+                comments_data = await self.fetch_comments(
+                    session, ticket_id, ticket_data.get('updated_at')
+                )
+            else:
+                # Fetch ticket and comments in parallel; the first failure (e.g. a 404)
+                # cancels the sibling request instead of waiting for it to finish
+                ticket_task = asyncio.ensure_future(self.fetch_ticket(session, ticket_id))
+                comments_task = asyncio.ensure_future(self.fetch_comments(session, ticket_id))
+                try:
+                    await asyncio.wait(
+                        (ticket_task, comments_task),
+                        return_when=asyncio.FIRST_EXCEPTION
+                    )
+                finally:
+                    pending = [task for task in (ticket_task, comments_task) if not task.done()]
+                    for task in pending:
+                        task.cancel()
+                    # Let cancelled siblings settle so every task is done below
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+                # Surface the real failure (ticket errors first), not the sibling's cancellation
+                for task in (ticket_task, comments_task):
+                    if not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+
+                ticket_data = ticket_task.result()
+                comments_data = comments_task.result()
+
+            # Post-processing stays on the event loop: it is plain dict assembly with
+            # memoized timestamp conversion (microseconds per ticket), well below what
+            # pickling ticket + comments to a process pool would cost
 
             # Parse custom fields
             custom_fields_data = self._parse_custom_fields(ticket_data)
@@ -157,28 +547,26 @@ class ZendeskFetcher:
                 "serial_no": serial_no,
                 "subject": ticket_data.get('subject', ''),
                 "description": ticket_data.get('description', ''),
-                "url": f"https://{config.ZENDESK_SUBDOMAIN}.zendesk.com/agent/tickets/{ticket_id}",
+                "url": self._ticket_url_prefix + str(ticket_id),
                 "status": ticket_data.get('status', 'unknown'),
                 "created_at": utils.convert_to_ist(ticket_data.get('created_at', '')),
                 "updated_at": utils.convert_to_ist(ticket_data.get('updated_at', '')),
                 "comments_count": len(comments_data),
                 "custom_fields": custom_fields_data,
-                "comments": [],
+                "comments": [
+                    {
+                        "id": str(comment.get('id', '')),
+                        "author_id": str(comment.get('author_id', '')),
+                        "author_name": self._get_author_name(comment),
+                        "created_at": utils.convert_to_ist(comment.get('created_at', '')),
+                        "body": comment.get('body', ''),
+                        "public": comment.get('public', True)
+                    }
+                    for comment in comments_data
+                ],
                 "processing_status": "success"
             }
 
-            # Process comments
-            for comment in comments_data:
-                processed_comment = {
-                    "id": str(comment.get('id', '')),
-                    "author_id": str(comment.get('author_id', '')),
-                    "author_name": self._get_author_name(comment),
-                    "created_at": utils.convert_to_ist(comment.get('created_at', '')),
-                    "body": comment.get('body', ''),
-                    "public": comment.get('public', True)
-                }
-                processed_ticket["comments"].append(processed_comment)
-
             self.logger.info(f"Successfully fetched complete data for ticket {ticket_id}")
             return processed_ticket
 
@@ -212,13 +600,12 @@ class ZendeskFetcher:
             Author name string
         """
         # Try via field if available, otherwise use author_id
-        via = comment.get('via', {})
-        if via:
-            source = via.get('source', {})
-            from_data = source.get('from', {})
-            name = from_data.get('name', '')
+        try:
+            name = comment['via']['source']['from']['name']
             if name:
                 return name
+        except (KeyError, TypeError):
+            pass
 
         # Fallback to author_id
         return f"User {comment.get('author_id', 'Unknown')}"
@@ -234,44 +621,19 @@ class ZendeskFetcher:
             Dictionary with parsed custom field values including escalation data
         """
         custom_fields_data = {}
-        custom_fields = ticket_data.get('custom_fields', [])
-
-        # Initialize variables for escalation fields (Phase 5)
-        cross_team_value = None
-        jira_ticket_url = None
-
-        # Extract all relevant custom fields
-        for field in custom_fields:
-            field_id = field.get('id')
-            field_value = field.get('value', '')
-
-            # "Was Diagnostic Panel used?" field (existing)
-            if field_id == config.DIAGNOSTICS_CUSTOM_FIELD_ID:
-                normalized_value = utils.normalize_diagnostics_field(field_value)
-                custom_fields_data['was_diagnostics_used'] = normalized_value
-                self.logger.debug(
-                    f"Parsed diagnostics custom field: raw='{field_value}', "
-                    f"normalized='{normalized_value}'"
-                )
+        field_handlers = self._field_handlers
 
-            # Cross Team field (Phase 5)
-            elif field_id == config.CROSS_TEAM_FIELD_ID:
-                cross_team_value = field_value
-                self.logger.debug(f"Parsed Cross Team field: raw='{field_value}'")
-
-            # JIRA Ticket field (Phase 5)
-            elif field_id == config.JIRA_TICKET_FIELD_ID:
-                jira_ticket_url = field_value
-                self.logger.debug(f"Parsed JIRA Ticket field: url='{field_value}'")
-
-            # Root Cause field (Phase 6 Enhancement)
-            elif field_id == config.ROOT_CAUSE_FIELD_ID:
-                root_cause_value = field_value if field_value else "Not provided"
-                custom_fields_data['support_root_cause'] = root_cause_value
-                self.logger.debug(
-                    f"Parsed Root Cause field: '{root_cause_value[:50]}...'"
-                    if len(str(root_cause_value)) > 50 else f"Parsed Root Cause field: '{root_cause_value}'"
-                )
+        # Extract all relevant custom fields (single dict lookup per field);
+        # skipped entirely when no custom field IDs are configured
+        for field in ticket_data.get('custom_fields', []) if field_handlers else ():
+            handler = field_handlers.get(field.get('id'))
+            if handler is not None:
+                key, value = handler(field.get('value', ''))
+                custom_fields_data[key] = value
+
+        # Escalation inputs are only used to derive escalation status (Phase 5)
+        cross_team_value = custom_fields_data.pop('cross_team', None)
+        jira_ticket_url = custom_fields_data.pop('jira_ticket_url', None)
 
         # Default diagnostics field if not found
         if 'was_diagnostics_used' not in custom_fields_data:
@@ -288,13 +650,39 @@ class ZendeskFetcher:
         custom_fields_data['escalation'] = escalation_data
 
         self.logger.debug(
-            f"Escalation status: is_escalated={escalation_data['is_escalated']}, "
-            f"cross_team={escalation_data['cross_team_status']}, "
-            f"jira_id={escalation_data['jira_ticket_id']}"
+            "Escalation status: is_escalated=%s, cross_team=%s, jira_id=%s",
+            escalation_data['is_escalated'],
+            escalation_data['cross_team_status'],
+            escalation_data['jira_ticket_id']
         )
 
         return custom_fields_data
 
+    def _parse_diagnostics_field(self, field_value) -> Tuple[str, str]:
+        """Parse the "Was Diagnostic Panel used?" field."""
+        normalized_value = utils.normalize_diagnostics_field(field_value)
+        self.logger.debug(
+            "Parsed diagnostics custom field: raw=%r, normalized=%r",
+            field_value, normalized_value
+        )
+        return 'was_diagnostics_used', normalized_value
+
+    def _parse_cross_team_field(self, field_value) -> Tuple[str, object]:
+        """Parse the Cross Team field (Phase 5)."""
+        self.logger.debug("Parsed Cross Team field: raw=%r", field_value)
+        return 'cross_team', field_value
+
+    def _parse_jira_ticket_field(self, field_value) -> Tuple[str, object]:
+        """Parse the JIRA Ticket field (Phase 5)."""
+        self.logger.debug("Parsed JIRA Ticket field: url=%r", field_value)
+        return 'jira_ticket_url', field_value
+
+    def _parse_root_cause_field(self, field_value) -> Tuple[str, object]:
+        """Parse the Root Cause field (Phase 6 Enhancement)."""
+        root_cause_value = field_value if field_value else "Not provided"
+        self.logger.debug("Parsed Root Cause field: %.50r", root_cause_value)
+        return 'support_root_cause', root_cause_value
+
     async def fetch_multiple_tickets(
         self,
         ticket_ids: List[tuple],
@@ -303,6 +691,9 @@ class ZendeskFetcher:
         """
         Fetch multiple tickets in parallel with rate limiting.
 
+        Thin wrapper around iter_tickets() that collects every result and restores
+        the input (CSV) order.
+
         Args:
             ticket_ids: List of tuples (serial_no, ticket_id)
             progress_callback: Optional callback function for progress updates
@@ -311,32 +702,87 @@ class ZendeskFetcher:
             List of ticket dictionaries (both successful and failed)
         """
         self.logger.info(f"Starting to fetch {len(ticket_ids)} tickets")
-        results = []
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
+        results = [ticket async for ticket in self.iter_tickets(ticket_ids, progress_callback)]
+
+        # iter_tickets yields in completion order - restore input order
+        input_order = {
+            (serial_no, ticket_id): index
+            for index, (serial_no, ticket_id) in enumerate(ticket_ids)
+        }
+        results.sort(key=lambda t: input_order.get((t.get('serial_no'), t.get('ticket_id')), 0))
 
-            for serial_no, ticket_id in ticket_ids:
-                task = self._fetch_with_progress(
+        self.logger.info(f"Completed fetching {len(results)} tickets")
+        return results
+
+    async def iter_tickets(
+        self,
+        ticket_ids: List[tuple],
+        progress_callback: Optional[Callable] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Fetch multiple tickets in parallel, yielding each one as soon as it completes.
+
+        Ticket metadata is fetched in batches of up to 100 via show_many, so each
+        ticket then needs only its comments request. Tickets missing from a batch
+        (or in a batch that failed) fall back to the individual ticket endpoint.
+
+        Args:
+            ticket_ids: List of tuples (serial_no, ticket_id)
+            progress_callback: Optional callback function for progress updates
+
+        Yields:
+            Ticket dictionaries (both successful and failed) in completion order
+        """
+        # Shared session - connection pool persists across batches until close()
+        session = await self._get_session()
+
+        # Batch ticket metadata via show_many (chunks of 100 IDs)
+        prefetched = {}
+        ids = [ticket_id for _, ticket_id in ticket_ids]
+        batch_size = config.ZENDESK_SHOW_MANY_BATCH_SIZE
+        batches = await asyncio.gather(
+            *(
+                self.fetch_tickets_batch(session, ids[i:i + batch_size])
+                for i in range(0, len(ids), batch_size)
+            ),
+            return_exceptions=True
+        )
+
+        for batch in batches:
+            if isinstance(batch, Exception):
+                self.logger.warning(f"show_many batch failed, falling back to per-ticket fetch: {batch}")
+            else:
+                prefetched.update(batch)
+
+        tasks = [
+            asyncio.ensure_future(
+                self._fetch_with_progress(
                     session,
                     ticket_id,
                     serial_no,
-                    progress_callback
+                    progress_callback,
+                    prefetched.get(str(ticket_id))
                 )
-                tasks.append(task)
-
-            # Execute all tasks and gather results
-            results = await asyncio.gather(*tasks, return_exceptions=False)
+            )
+            for serial_no, ticket_id in ticket_ids
+        ]
 
-        self.logger.info(f"Completed fetching {len(results)} tickets")
-        return results
+        # Yield tickets as they finish; cancel the rest if the consumer stops early
+        try:
+            for next_ticket in asyncio.as_completed(tasks):
+                yield await next_ticket
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _fetch_with_progress(
         self,
         session: aiohttp.ClientSession,
         ticket_id: str,
         serial_no: int,
-        progress_callback: Optional[Callable]
+        progress_callback: Optional[Callable],
+        ticket_data: Optional[Dict] = None
     ) -> Dict:
         """
         Fetch a ticket and call progress callback.
@@ -346,11 +792,12 @@ class ZendeskFetcher:
             ticket_id: Zendesk ticket ID
             serial_no: Serial number from CSV
             progress_callback: Callback function for progress updates
+            ticket_data: Optional prefetched ticket metadata (from show_many)
 
         Returns:
             Ticket dictionary
         """
-        result = await self.fetch_ticket_complete(session, ticket_id, serial_no)
+        result = await self.fetch_ticket_complete(session, ticket_id, serial_no, ticket_data)
 
         # Call progress callback if provided
         if progress_callback:
@@ -10,15 +10,24 @@ Rationale: Allows switching between LLM providers without changing business logi
 enabling cost optimization and avoiding free-tier API limits.
 """
 
+import atexit
 import logging
 import asyncio
-from typing import Dict, Any
-from openai import AzureOpenAI
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
-from google import genai
+# Provider SDKs (openai, google-genai) are imported lazily inside each client's
+# __init__, so a run only pays the import cost of the provider it actually uses
 
 import config
 import utils
+from response_cache import ResponseCache
+
+
+logger = logging.getLogger("ticket_summarizer.llm_provider")
 
 
 # ============================================================================
@@ -33,8 +42,11 @@ class LLMResponse:
     Azure OpenAI returns response.choices[0].message.content.
 
     This wrapper normalizes both to provide a consistent .text property.
+    Uses __slots__ (no per-instance __dict__) since one is created per LLM call.
     """
 
+    __slots__ = ("text", "_raw_response")
+
     def __init__(self, text: str, raw_response: Any = None):
         """
         Initialize LLM response wrapper.
@@ -47,11 +59,184 @@ class LLMResponse:
         self._raw_response = raw_response
 
 
+# ============================================================================
+# SHARED HTTP CONNECTION POOLS
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _shared_http_clients():
+    """
+    Build the httpx connection pools shared by the Azure OpenAI SDK clients.
+
+    One sync and one async pool (httpx can't share a pool across the two), sized
+    from config and reused by every AzureOpenAIClient instead of each SDK client
+    opening its own. The google-genai client manages its own transport and does
+    not use these pools. The sync pool is closed at interpreter exit.
+
+    Returns:
+        Tuple of (httpx.Client, httpx.AsyncClient)
+    """
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+    timeout = httpx.Timeout(config.LLM_HTTP_TIMEOUT_SECONDS)
+
+    sync_client = httpx.Client(limits=limits, timeout=timeout)
+    async_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    atexit.register(sync_client.close)
+    return sync_client, async_client
+
+
+@lru_cache(maxsize=1)
+def _shared_response_store() -> Optional[ResponseCache]:
+    """
+    Open the process-wide on-disk LLM response store, if persistence is enabled.
+
+    Returns:
+        ResponseCache at LLM_RESPONSE_CACHE_PATH, or None when LLM_RESPONSE_CACHE_PERSIST is off
+    """
+    if not config.LLM_RESPONSE_CACHE_PERSIST:
+        return None
+    store = ResponseCache(config.LLM_RESPONSE_CACHE_PATH)
+    store.purge(config.LLM_RESPONSE_CACHE_TTL_SECONDS)
+    atexit.register(store.close)
+    return store
+
+
+# ============================================================================
+# BASE CLIENT (shared async helpers)
+# ============================================================================
+
+class BaseLLMClient:
+    """
+    Shared behaviour for provider clients.
+
+    Subclasses implement generate_content() and generate_content_async().
+    Identical prompts are answered from an in-process LRU of responses
+    (LLM_RESPONSE_CACHE_SIZE entries), backed by an on-disk store across runs
+    when LLM_RESPONSE_CACHE_PERSIST is enabled.
+    Responses enter the cache only through cache_response(), after the caller
+    has validated them.
+
+    Only the async path is paced by the client-side token bucket (an asyncio
+    primitive). The synchronous generate_content() is for one-off calls outside
+    the pipeline and relies on the provider's own 429 handling instead.
+    """
+
+    def __init__(self, cache_namespace: str, requests_per_minute: int):
+        """
+        Initialize shared client state.
+
+        Args:
+            cache_namespace: Model/deployment name mixed into response cache keys
+            requests_per_minute: Provider request quota enforced client-side
+        """
+        self._cache_namespace = cache_namespace
+        self._response_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._response_store = _shared_response_store()
+
+        # Paces async calls to the provider quota instead of bursting into 429 backoff.
+        # LLM responses carry no rate-limit headers to drain a full bucket, so the
+        # burst stays small and requests are spread evenly from the first call
+        self.rate_limiter = utils.TokenBucket(requests_per_minute, burst=config.LLM_RATE_LIMIT_BURST)
+
+    def _response_cache_key(self, prompt: str, static_prefix: Optional[str] = None) -> bytes:
+        """
+        Build a content-hash cache key for a prompt.
+
+        Args:
+            prompt: The prompt text
+            static_prefix: Optional prompt prefix sent with the prompt
+
+        Returns:
+            16-byte blake2b digest of model + prefix + prompt
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._cache_namespace.encode())
+        digest.update(b"\0")
+        digest.update((static_prefix or "").encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.digest()
+
+    def _get_cached_response(self, key: bytes) -> Optional[Any]:
+        """
+        Look up a cached response, marking it most recently used.
+
+        Args:
+            key: Cache key from _response_cache_key()
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+            self.logger.debug("LLM response cache hit")
+            return response
+
+        if self._response_store is not None:
+            entry = self._response_store.get(f"llm:{key.hex()}")
+            if entry is not None and ResponseCache.is_fresh(entry, config.LLM_RESPONSE_CACHE_TTL_SECONDS):
+                self.logger.debug("LLM response cache hit (on disk)")
+                response = LLMResponse(text=entry.body.decode("utf-8"))
+                self._cache_response(key, response, persist=False)
+                return response
+
+        return None
+
+    def cache_response(self, prompt: str, response: Any, static_prefix: Optional[str] = None) -> None:
+        """
+        Remember a response once the caller has parsed it successfully.
+
+        generate_content*() only read the cache; callers commit a response here after
+        validating it, so a malformed answer is never replayed from the cache.
+
+        Args:
+            prompt: The prompt text the response answers
+            response: Response object returned by generate_content*()
+            static_prefix: Optional prompt prefix sent with the prompt
+        """
+        self._cache_response(self._response_cache_key(prompt, static_prefix), response)
+
+    def _cache_response(self, key: bytes, response: Any, persist: bool = True) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key from _response_cache_key()
+            response: Response object to cache
+            persist: Also write the response text to the on-disk store (if enabled)
+        """
+        # Never cache empty responses - callers treat them as failures and retry
+        text = getattr(response, 'text', None)
+        if not text:
+            return
+
+        if persist and self._response_store is not None:
+            self._response_store.set(f"llm:{key.hex()}", text.encode("utf-8"))
+
+        if config.LLM_RESPONSE_CACHE_SIZE <= 0:
+            return
+        # Keep only the text - raw SDK responses would pin their payloads in the LRU
+        if not isinstance(response, LLMResponse) or response._raw_response is not None:
+            response = LLMResponse(text=text)
+        self._response_cache[key] = response
+        if len(self._response_cache) > config.LLM_RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def aclose(self) -> None:
+        """Release provider-side resources created by this client (no-op by default)."""
+
+
 # ============================================================================
 # AZURE OPENAI CLIENT WRAPPER
 # ============================================================================
 
-class AzureOpenAIClient:
+class AzureOpenAIClient(BaseLLMClient):
     """
     Wrapper for Azure OpenAI API that matches Gemini's interface.
 
@@ -59,6 +244,12 @@ class AzureOpenAIClient:
     Implements the same generate_content() method as Gemini for seamless switching.
     """
 
+    # Shared by every request (never mutated) - only the user message varies per call
+    _SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are an expert support ticket analyst. Provide accurate, structured analysis based only on the provided ticket data."
+    }
+
     def __init__(self):
         """
         Initialize Azure OpenAI client with credentials from config.
@@ -66,35 +257,58 @@ class AzureOpenAIClient:
         Raises:
             ValueError: If Azure credentials are missing or invalid
         """
-        self.logger = logging.getLogger("ticket_summarizer.llm_provider")
-
-        # Validate Azure credentials
-        if not config.AZURE_OPENAI_ENDPOINT:
-            raise ValueError(
-                "AZURE_OPENAI_ENDPOINT environment variable is not set. "
-                "Please add it to your .env file."
-            )
-        if not config.AZURE_OPENAI_API_KEY:
-            raise ValueError(
-                "AZURE_OPENAI_API_KEY environment variable is not set. "
-                "Please add it to your .env file."
+        self.logger = logger
+
+        # Validate Azure credentials (single pass, reports every missing variable)
+        missing = [
+            name for name, value in (
+                ("AZURE_OPENAI_ENDPOINT", config.AZURE_OPENAI_ENDPOINT),
+                ("AZURE_OPENAI_API_KEY", config.AZURE_OPENAI_API_KEY),
+                ("AZURE_OPENAI_DEPLOYMENT_NAME", config.AZURE_OPENAI_DEPLOYMENT_NAME),
             )
-        if not config.AZURE_OPENAI_DEPLOYMENT_NAME:
+            if not value
+        ]
+        if missing:
             raise ValueError(
-                "AZURE_OPENAI_DEPLOYMENT_NAME environment variable is not set. "
-                "Please add it to your .env file."
+                f"{', '.join(missing)} environment variable(s) not set. "
+                "Please add them to your .env file."
             )
 
         self.logger.info("Initializing Azure OpenAI client")
 
+        from openai import AzureOpenAI, AsyncAzureOpenAI
+
+        http_client, async_http_client = _shared_http_clients()
+
         # Initialize Azure OpenAI client using modern SDK
         self.client = AzureOpenAI(
             azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
             api_key=config.AZURE_OPENAI_API_KEY,
-            api_version=config.AZURE_OPENAI_API_VERSION
+            api_version=config.AZURE_OPENAI_API_VERSION,
+            http_client=http_client
+        )
+
+        # Native async client for generate_content_async (no thread hop per call)
+        self.async_client = AsyncAzureOpenAI(
+            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
+            api_key=config.AZURE_OPENAI_API_KEY,
+            api_version=config.AZURE_OPENAI_API_VERSION,
+            http_client=async_http_client
         )
 
         self.deployment_name = config.AZURE_OPENAI_DEPLOYMENT_NAME
+
+        # Fixed completion parameters, built once and splatted into every request
+        self._completion_kwargs = {
+            "model": self.deployment_name,  # This is the deployment name, not model name
+            "temperature": 0.3,  # Lower temperature for more consistent, factual responses
+            "max_tokens": 2000,  # Sufficient for ticket analysis
+            "top_p": 0.95
+        }
+        super().__init__(
+            cache_namespace=f"azure:{self.deployment_name}",
+            requests_per_minute=config.AZURE_REQUESTS_PER_MINUTE
+        )
         self.logger.info(f"Azure OpenAI client initialized with deployment: {self.deployment_name}")
 
     def generate_content(self, prompt: str) -> LLMResponse:
@@ -113,34 +327,29 @@ class AzureOpenAIClient:
         Raises:
             utils.GeminiAPIError: Renamed to match existing error handling (actually Azure error)
         """
+        cache_key = self._response_cache_key(prompt)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.debug(f"Calling Azure OpenAI with deployment: {self.deployment_name}")
+            self.logger.debug("Calling Azure OpenAI with deployment: %s", self.deployment_name)
 
             # Call Azure OpenAI chat completions API
             response = self.client.chat.completions.create(
-                model=self.deployment_name,  # This is the deployment name, not model name
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert support ticket analyst. Provide accurate, structured analysis based only on the provided ticket data."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent, factual responses
-                max_tokens=2000,  # Sufficient for ticket analysis
-                top_p=0.95
+                messages=[self._SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                **self._completion_kwargs
             )
 
             # Extract text from response
             generated_text = response.choices[0].message.content
 
-            self.logger.debug(f"Azure OpenAI response received: {len(generated_text)} characters")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Azure OpenAI response received: %d characters", len(generated_text))
 
             # Return wrapped response with consistent interface
-            return LLMResponse(text=generated_text, raw_response=response)
+            llm_response = LLMResponse(text=generated_text, raw_response=response)
+            return llm_response
 
         except Exception as e:
             self.logger.error(f"Azure OpenAI API call failed: {e}")
@@ -148,12 +357,61 @@ class AzureOpenAIClient:
             # (Will rename to LLMAPIError in future refactoring)
             raise utils.GeminiAPIError(f"Azure OpenAI API call failed: {e}")
 
+    async def generate_content_async(self, prompt: str, static_prefix: Optional[str] = None) -> LLMResponse:
+        """
+        Generate content using Azure OpenAI (native async).
+
+        Same request shape as generate_content(), but awaits AsyncAzureOpenAI
+        directly instead of blocking a worker thread for the whole LLM latency.
+
+        When static_prefix is given it is placed at the start of the user message,
+        so Azure OpenAI's automatic prefix cache can reuse it across requests.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+            static_prefix: Optional prompt prefix shared by every request
+
+        Returns:
+            LLMResponse object with .text property containing generated content
+
+        Raises:
+            utils.GeminiAPIError: Renamed to match existing error handling (actually Azure error)
+        """
+        cache_key = self._response_cache_key(prompt, static_prefix)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            self.logger.debug("Calling Azure OpenAI (async) with deployment: %s", self.deployment_name)
+
+            await self.rate_limiter.acquire()
+            response = await self.async_client.chat.completions.create(
+                messages=[
+                    self._SYSTEM_MESSAGE,
+                    {"role": "user", "content": f"{static_prefix}{prompt}" if static_prefix else prompt}
+                ],
+                **self._completion_kwargs
+            )
+
+            generated_text = response.choices[0].message.content
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Azure OpenAI response received: %d characters", len(generated_text))
+
+            llm_response = LLMResponse(text=generated_text, raw_response=response)
+            return llm_response
+
+        except Exception as e:
+            self.logger.error(f"Azure OpenAI API call failed: {e}")
+            raise utils.GeminiAPIError(f"Azure OpenAI API call failed: {e}")
+
 
 # ============================================================================
 # GEMINI CLIENT WRAPPER (for consistency)
 # ============================================================================
 
-class GeminiClient:
+class GeminiClient(BaseLLMClient):
     """
     Wrapper for Google Gemini API using the new unified google-genai SDK.
 
@@ -168,7 +426,7 @@ class GeminiClient:
         Raises:
             ValueError: If Gemini API key is missing
         """
-        self.logger = logging.getLogger("ticket_summarizer.llm_provider")
+        self.logger = logger
 
         # Validate Gemini credentials
         if not config.GEMINI_API_KEY:
@@ -179,9 +437,22 @@ class GeminiClient:
 
         self.logger.info("Initializing Gemini client with new google-genai SDK")
 
+        from google import genai
+        from google.genai import types
+
         # Initialize new unified Google GenAI client
         self.client = genai.Client(api_key=config.GEMINI_API_KEY)
+        self._types = types
         self.model_name = config.GEMINI_MODEL
+        super().__init__(
+            cache_namespace=f"gemini:{self.model_name}",
+            requests_per_minute=config.GEMINI_REQUESTS_PER_MINUTE
+        )
+
+        # Explicit context caches for static prompt prefixes (prefix -> (cache name,
+        # monotonic expiry), or None if caching is unavailable for this model/tier)
+        self._prompt_caches: Dict[str, Optional[Tuple[str, float]]] = {}
+        self._prompt_cache_lock = asyncio.Lock()
 
         self.logger.info(f"Gemini client initialized with model: {self.model_name}")
 
@@ -201,8 +472,13 @@ class GeminiClient:
         Raises:
             utils.GeminiAPIError: If API call fails
         """
+        cache_key = self._response_cache_key(prompt)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.debug(f"Calling Gemini with model: {self.model_name}")
+            self.logger.debug("Calling Gemini with model: %s", self.model_name)
 
             # Call new Google GenAI SDK (returns response with .text property)
             response = self.client.models.generate_content(
@@ -210,7 +486,164 @@ class GeminiClient:
                 contents=prompt
             )
 
-            self.logger.debug(f"Gemini response received: {len(response.text)} characters")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Gemini response received: %d characters", len(response.text))
+
+            return response
+
+        except Exception as e:
+            self.logger.error(f"Gemini API call failed: {e}")
+            raise utils.GeminiAPIError(f"Gemini API call failed: {e}")
+
+    def _prompt_cache_usable(self, static_prefix: str) -> bool:
+        """
+        Check whether a prompt cache entry exists and is not about to expire.
+
+        Args:
+            static_prefix: Prompt prefix shared by every request
+
+        Returns:
+            True if the stored entry can be used as-is (including a None "unavailable" entry)
+        """
+        if static_prefix not in self._prompt_caches:
+            return False
+        entry = self._prompt_caches[static_prefix]
+        return entry is None or time.monotonic() < entry[1]
+
+    async def _get_prompt_cache(self, static_prefix: str) -> Optional[str]:
+        """
+        Get (or create) an explicit Gemini context cache for a static prompt prefix.
+
+        Caches are recreated shortly before their TTL lapses, so a long run never
+        references expired cached content.
+
+        Args:
+            static_prefix: Prompt prefix shared by every request
+
+        Returns:
+            Cached content name, or None if explicit caching is unavailable
+        """
+        if not self._prompt_cache_usable(static_prefix):
+            async with self._prompt_cache_lock:
+                if not self._prompt_cache_usable(static_prefix):
+                    await self._create_prompt_cache(static_prefix)
+
+        entry = self._prompt_caches[static_prefix]
+        return entry[0] if entry is not None else None
+
+    async def _create_prompt_cache(self, static_prefix: str) -> None:
+        """
+        Create a context cache for a static prompt prefix and record its expiry.
+
+        Args:
+            static_prefix: Prompt prefix shared by every request
+        """
+        try:
+            cache = await self.client.aio.caches.create(
+                model=self.model_name,
+                config=self._types.CreateCachedContentConfig(
+                    contents=[static_prefix],
+                    ttl=f"{config.GEMINI_PROMPT_CACHE_TTL_SECONDS}s"
+                )
+            )
+            refresh_after = max(
+                config.GEMINI_PROMPT_CACHE_TTL_SECONDS - config.GEMINI_PROMPT_CACHE_REFRESH_MARGIN_SECONDS,
+                0
+            )
+            self._prompt_caches[static_prefix] = (cache.name, time.monotonic() + refresh_after)
+            self.logger.info(f"Created Gemini prompt cache: {cache.name}")
+        except Exception as e:
+            # Explicit caching needs a minimum token count and isn't available
+            # on every model/tier - fall back to sending the full prompt
+            self._prompt_caches[static_prefix] = None
+            self.logger.warning(f"Gemini prompt caching unavailable, sending full prompts: {e}")
+
+    @staticmethod
+    def _is_cached_content_error(error: Exception) -> bool:
+        """
+        Check whether an API error means the referenced cached content is gone.
+
+        Args:
+            error: Exception raised by generate_content
+
+        Returns:
+            True for not-found/permission errors on the cached content
+        """
+        return getattr(error, 'code', None) in (403, 404) or "cached content" in str(error).lower()
+
+    async def aclose(self) -> None:
+        """Delete the context caches this client created (they otherwise live until their TTL)."""
+        for entry in self._prompt_caches.values():
+            if entry is None:
+                continue
+            try:
+                await self.client.aio.caches.delete(name=entry[0])
+                self.logger.debug("Deleted Gemini prompt cache: %s", entry[0])
+            except Exception as e:
+                self.logger.warning(f"Failed to delete Gemini prompt cache {entry[0]}: {e}")
+        self._prompt_caches.clear()
+
+    async def generate_content_async(self, prompt: str, static_prefix: Optional[str] = None) -> Any:
+        """
+        Generate content using Gemini (native async).
+
+        Uses the google-genai SDK's async surface (client.aio) so the event loop
+        can multiplex in-flight calls without an executor thread per request.
+
+        When static_prefix is given, it is stored once in an explicit context cache
+        and referenced via cached_content, so only the dynamic prompt is sent per call.
+
+        Args:
+            prompt: The prompt text to send to the LLM
+            static_prefix: Optional prompt prefix shared by every request
+
+        Returns:
+            Gemini response object with .text property
+
+        Raises:
+            utils.GeminiAPIError: If API call fails
+        """
+        cache_key = self._response_cache_key(prompt, static_prefix)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            self.logger.debug("Calling Gemini (async) with model: %s", self.model_name)
+
+            await self.rate_limiter.acquire()
+
+            contents = prompt
+            generation_config = None
+
+            if static_prefix:
+                cache_name = await self._get_prompt_cache(static_prefix)
+                if cache_name:
+                    generation_config = self._types.GenerateContentConfig(cached_content=cache_name)
+                else:
+                    contents = f"{static_prefix}{prompt}"
+
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=generation_config
+                )
+            except Exception as e:
+                if generation_config is None or not self._is_cached_content_error(e):
+                    raise
+                # The context cache expired or was deleted server-side - forget it
+                # (recreated on the next call) and resend this request in full
+                self.logger.warning(f"Gemini prompt cache unusable, resending full prompt: {e}")
+                self._prompt_caches.pop(static_prefix, None)
+                await self.rate_limiter.acquire()
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=f"{static_prefix}{prompt}"
+                )
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Gemini response received: %d characters", len(response.text))
 
             return response
 
@@ -223,6 +656,35 @@ class GeminiClient:
 # LLM PROVIDER FACTORY
 # ============================================================================
 
+# Provider name → client class
+_PROVIDERS = {
+    "gemini": GeminiClient,
+    "azure": AzureOpenAIClient,
+}
+
+# Clients handed out by _build_provider(), released by LLMProviderFactory.close_all()
+_built_clients: List[BaseLLMClient] = []
+
+# Provider name → config settings (named after their environment variables) it requires
+_REQUIRED_CREDENTIALS = {
+    "gemini": ("GEMINI_API_KEY",),
+    "azure": ("AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_KEY", "AZURE_OPENAI_DEPLOYMENT_NAME"),
+}
+
+
+def _missing_credentials(provider_name: str) -> List[str]:
+    """
+    List the credential environment variables a provider needs but doesn't have.
+
+    Args:
+        provider_name: Normalized provider name
+
+    Returns:
+        Names of unset variables (empty if all are present)
+    """
+    return [name for name in _REQUIRED_CREDENTIALS[provider_name] if not getattr(config, name)]
+
+
 class LLMProviderFactory:
     """
     Factory for creating LLM provider instances.
@@ -242,6 +704,9 @@ class LLMProviderFactory:
         """
         Get LLM provider instance based on name.
 
+        Clients are memoized per provider, so the synthesizer and diagnostics
+        analyzer share one SDK client (and its connection pool).
+
         Args:
             provider_name: Provider name ("gemini" or "azure")
 
@@ -256,23 +721,39 @@ class LLMProviderFactory:
             >>> response = provider.generate_content("Hello")
             >>> print(response.text)
         """
-        logger = logging.getLogger("ticket_summarizer.llm_provider")
+        # Canonical names (the common case) skip the normalization round-trip
+        if provider_name not in _PROVIDERS:
+            provider_name = provider_name.lower().strip()
+        return _build_provider(provider_name)
 
-        provider_name_lower = provider_name.lower().strip()
+    @staticmethod
+    async def close_all() -> None:
+        """Release provider-side resources held by every memoized client."""
+        for client in list(_built_clients):
+            await client.aclose()
 
-        if provider_name_lower == "gemini":
-            logger.info("Creating Gemini LLM provider")
-            return GeminiClient()
+    @staticmethod
+    def missing_credentials(provider_name: str) -> List[str]:
+        """
+        List the credential environment variables a provider needs but doesn't have.
 
-        elif provider_name_lower == "azure":
-            logger.info("Creating Azure OpenAI LLM provider")
-            return AzureOpenAIClient()
+        Args:
+            provider_name: Provider name ("gemini" or "azure")
 
-        else:
-            raise ValueError(
-                f"Invalid model provider: '{provider_name}'. "
-                f"Supported providers: 'gemini', 'azure'"
-            )
+        Returns:
+            Names of unset variables (empty if all are present)
+
+        Raises:
+            ValueError: If provider_name is invalid
+        """
+        if provider_name not in _REQUIRED_CREDENTIALS:
+            provider_name = provider_name.lower().strip()
+            if provider_name not in _REQUIRED_CREDENTIALS:
+                raise ValueError(
+                    f"Invalid model provider: '{provider_name}'. "
+                    f"Supported providers: 'gemini', 'azure'"
+                )
+        return _missing_credentials(provider_name)
 
     @staticmethod
     def validate_provider_credentials(provider_name: str) -> bool:
@@ -288,16 +769,43 @@ class LLMProviderFactory:
         Returns:
             True if credentials exist, False otherwise
         """
-        provider_name_lower = provider_name.lower().strip()
+        if provider_name not in _REQUIRED_CREDENTIALS:
+            provider_name = provider_name.lower().strip()
+            if provider_name not in _REQUIRED_CREDENTIALS:
+                return False
+        return not _missing_credentials(provider_name)
 
-        if provider_name_lower == "gemini":
-            return bool(config.GEMINI_API_KEY)
 
-        elif provider_name_lower == "azure":
-            return bool(
-                config.AZURE_OPENAI_ENDPOINT and
-                config.AZURE_OPENAI_API_KEY and
-                config.AZURE_OPENAI_DEPLOYMENT_NAME
-            )
+@lru_cache(maxsize=4)
+def _build_provider(provider_name: str):
+    """
+    Build an LLM client for a normalized provider name (memoized).
+
+    Args:
+        provider_name: Lowercased, stripped provider name
+
+    Returns:
+        Configured LLM client (GeminiClient or AzureOpenAIClient)
+
+    Raises:
+        ValueError: If provider_name is invalid or credentials are missing
+    """
+    client_class = _PROVIDERS.get(provider_name)
+    if client_class is None:
+        raise ValueError(
+            f"Invalid model provider: '{provider_name}'. "
+            f"Supported providers: 'gemini', 'azure'"
+        )
+
+    # Fail fast before constructing anything (and before importing the SDK)
+    missing = _missing_credentials(provider_name)
+    if missing:
+        raise ValueError(
+            f"Missing environment variables for model provider '{provider_name}': "
+            f"{', '.join(missing)}. Please add them to your .env file."
+        )
 
-        return False
+    logger.info("Creating %s LLM provider", client_class.__name__)
+    client = client_class()
+    _built_clients.append(client)
+    return client
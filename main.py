@@ -9,27 +9,81 @@ Usage:
     python main.py --input <csv_path> --analysis-type <pod|diagnostics|both>
 """
 
+import os
 import sys
 import csv
-import json
 import asyncio
 import time
 import argparse
+import logging
+import operator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, reduce
 from pathlib import Path
-from typing import List, Tuple
-from rich.console import Console
+from typing import List, Optional, Tuple
+import orjson
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+try:
+    # libuv-backed event loop (Linux/macOS); falls back to the default loop elsewhere
+    import uvloop
+except ImportError:
+    uvloop = None
 
 import config
 import utils
 from fetcher import ZendeskFetcher
 from synthesizer import GeminiSynthesizer
-from categorizer import TicketCategorizer
-from diagnostics_analyzer import DiagnosticsAnalyzer
 from csv_exporter import CSVExporter
+from llm_provider import LLMProviderFactory
+
+# Same layout as json.dump(..., indent=2, ensure_ascii=False)
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# LLM confidence label → stats key (POD categorization / diagnostics analysis)
+_CATEGORIZATION_CONFIDENCE_STATS = {
+    "confident": "confident_count",
+    "not confident": "not_confident_count"
+}
+_DIAGNOSTICS_CONFIDENCE_STATS = {
+    "confident": "confident",
+    "not confident": "not_confident"
+}
+
+# Keys copied from diagnostics results onto categorized tickets in "both" mode
+_DIAGNOSTICS_RESULT_KEYS = ("diagnostics_analysis", "diagnostics_analysis_status")
+
+# Summary table breakdown rows: (label, path into self.stats, style)
+_SUMMARY_ROWS = {
+    "pod_confidence": (
+        ("  • Confident:", ("confident_count",), "green"),
+        ("  • Not Confident:", ("not_confident_count",), "yellow"),
+    ),
+    "diagnostics_was_used": (
+        ("  • Yes:", ("diagnostics_was_used", "yes"), "green"),
+        ("  • No:", ("diagnostics_was_used", "no"), "red"),
+        ("  • Unknown:", ("diagnostics_was_used", "unknown"), "yellow"),
+    ),
+    "diagnostics_could_help": (
+        ("  • Yes:", ("diagnostics_could_help", "yes"), "green"),
+        ("  • No:", ("diagnostics_could_help", "no"), "red"),
+        ("  • Maybe:", ("diagnostics_could_help", "maybe"), "yellow"),
+    ),
+    "diagnostics_confidence": (
+        ("  • Confident:", ("diagnostics_confidence", "confident"), "green"),
+        ("  • Not Confident:", ("diagnostics_confidence", "not_confident"), "yellow"),
+    ),
+    "both_could_help": (
+        ("  • Could Help (Yes):", ("diagnostics_could_help", "yes"), "green"),
+        ("  • Could Help (No):", ("diagnostics_could_help", "no"), "red"),
+    ),
+}
 
 
 class TicketSummarizer:
@@ -46,22 +100,56 @@ class TicketSummarizer:
         - Console for rich terminal output
         - Fetcher for Zendesk API calls (Phase 1)
         - Synthesizer for LLM summarization (Phase 2)
-        - Categorizer for POD assignment (Phase 3a) - Phase 2
-        - Diagnostics Analyzer for Diagnostics analysis (Phase 3b) - Phase 3b
+        - Categorizer for POD assignment (Phase 3a) - Phase 2, built on first use
+        - Diagnostics Analyzer for Diagnostics analysis (Phase 3b) - Phase 3b, built on first use
+        - CSV exporter for spreadsheet output (Phase 5)
         - Statistics tracking for all phases
 
         Args:
             analysis_type: Type of analysis to perform ("pod", "diagnostics", or "both")
             model_provider: LLM provider to use ("gemini" or "azure")
+
+        Raises:
+            ValueError: If model_provider is invalid or its credentials are missing
         """
         self.logger = utils.setup_logger("ticket_summarizer")
         self.console = Console()
+
+        # Log file the logger writes to, resolved once for the summary (same date as the handler)
+        self.log_filepath = next(
+            (
+                os.path.relpath(handler.baseFilename)
+                for handler in self.logger.handlers
+                if isinstance(handler, logging.FileHandler)
+            ),
+            config.LOG_DIR
+        )
+
+        # One long-lived progress display hosting a task per phase (started in run())
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=self.console,
+            refresh_per_second=4
+        )
         self.analysis_type = analysis_type
         self.model_provider = model_provider
+
+        # Fail fast on missing LLM credentials: the Phase 3a/3b components are built
+        # lazily, after fetch and synthesis, so their provider is validated here
+        missing = LLMProviderFactory.missing_credentials(model_provider)
+        if missing:
+            raise ValueError(
+                f"Missing environment variables for model provider '{model_provider}': "
+                f"{', '.join(missing)}. Please add them to your .env file."
+            )
+
         self.fetcher = ZendeskFetcher()
         self.synthesizer = GeminiSynthesizer(model_provider=model_provider)  # Phase 3c: Multi-model
-        self.categorizer = TicketCategorizer()  # Phase 3a: POD categorization
-        self.diagnostics_analyzer = DiagnosticsAnalyzer(model_provider=model_provider)  # Phase 3b + 3c
+        # Phase 3a/3b components are built on first use (see categorizer/diagnostics_analyzer)
+        self.csv_exporter = CSVExporter()  # Phase 5
 
         # Statistics tracking for all phases
         self.stats = {
@@ -75,7 +163,7 @@ class TicketSummarizer:
             "categorization_failed": 0,
             "confident_count": 0,
             "not_confident_count": 0,
-            "pod_distribution": {},
+            "pod_distribution": Counter(),
             # Diagnostics analysis stats (Phase 3b)
             "diagnostics_analysis_success": 0,
             "diagnostics_analysis_failed": 0,
@@ -84,10 +172,31 @@ class TicketSummarizer:
             "diagnostics_confidence": {"confident": 0, "not_confident": 0},
             # Engineering escalation stats (Phase 5)
             "escalated_count": 0,
+            # time.perf_counter() readings (monotonic; only differences are meaningful)
             "start_time": None,
             "end_time": None
         }
 
+        # Indices of successfully synthesized tickets, computed once at the end of
+        # fetch_and_synthesis_phase and reused by the categorization/diagnostics phases
+        self._synthesized_idx: List[int] = []
+
+    @cached_property
+    def categorizer(self):
+        """
+        POD categorizer (Phase 3a), built only for "pod" and "both" runs.
+
+        Uses the run's --model-provider, sharing the synthesizer's provider client.
+        """
+        from categorizer import TicketCategorizer
+        return TicketCategorizer(model_provider=self.model_provider)
+
+    @cached_property
+    def diagnostics_analyzer(self):
+        """Diagnostics analyzer (Phase 3b + 3c), built only for "diagnostics" and "both" runs."""
+        from diagnostics_analyzer import DiagnosticsAnalyzer
+        return DiagnosticsAnalyzer(model_provider=self.model_provider)
+
     def load_csv(self, csv_path: str) -> List[Tuple[int, str]]:
         """
         Load ticket IDs from CSV file with auto-detection of format.
@@ -96,11 +205,13 @@ class TicketSummarizer:
         1. Format 1: "Serial No, Ticket ID" (Phase 1 format)
         2. Format 2: "Zendesk Tickets ID" (Phase 2 format - auto-generates serial numbers)
 
+        Repeated ticket IDs are dropped with a warning (first occurrence wins).
+
         Args:
             csv_path: Path to input CSV file
 
         Returns:
-            List of tuples (serial_no, ticket_id)
+            List of tuples (serial_no, ticket_id), one per distinct ticket ID
 
         Raises:
             FileNotFoundError: If CSV file doesn't exist
@@ -109,30 +220,31 @@ class TicketSummarizer:
         if not Path(csv_path).exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        ticket_ids = []
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            # Plain rows + header indices (no per-row dict); blank lines are skipped like DictReader
+            reader = csv.reader(f)
 
             # Auto-detect CSV format based on headers
-            headers = reader.fieldnames
+            headers = next(reader, [])
 
             # Format 1: "Serial No, Ticket ID"
             if 'Serial No' in headers and 'Ticket ID' in headers:
                 self.logger.info("Detected CSV Format 1: Serial No, Ticket ID")
-                for row in reader:
-                    serial_no = int(row['Serial No'])
-                    ticket_id = str(row['Ticket ID']).strip()
-                    ticket_ids.append((serial_no, ticket_id))
+                serial_idx = headers.index('Serial No')
+                ticket_idx = headers.index('Ticket ID')
+                ticket_ids = [
+                    (int(row[serial_idx]), row[ticket_idx].strip())
+                    for row in reader if row
+                ]
 
             # Format 2: "Zendesk Tickets ID" (auto-generate serial numbers)
             elif 'Zendesk Tickets ID' in headers:
                 self.logger.info("Detected CSV Format 2: Zendesk Tickets ID (auto-generating serial numbers)")
-                serial_no = 1
-                for row in reader:
-                    ticket_id = str(row['Zendesk Tickets ID']).strip()
-                    ticket_ids.append((serial_no, ticket_id))
-                    serial_no += 1
+                ticket_idx = headers.index('Zendesk Tickets ID')
+                ticket_ids = [
+                    (serial_no, row[ticket_idx].strip())
+                    for serial_no, row in enumerate((row for row in reader if row), start=1)
+                ]
 
             # Unsupported format
             else:
@@ -143,52 +255,92 @@ class TicketSummarizer:
                     f"Found: {headers}"
                 )
 
+        # Drop repeated ticket IDs: "both" mode merges the two analyses by ticket_id,
+        # and a repeat would only be fetched and analysed twice
+        seen = set()
+        unique_ticket_ids = []
+        duplicates = Counter()
+        for serial_no, ticket_id in ticket_ids:
+            if ticket_id in seen:
+                duplicates[ticket_id] += 1
+            else:
+                seen.add(ticket_id)
+                unique_ticket_ids.append((serial_no, ticket_id))
+
+        if duplicates:
+            self.logger.warning(f"Skipping duplicate ticket IDs in {csv_path}: {', '.join(duplicates)}")
+            self.console.print(
+                f"[yellow]⚠[/yellow] Skipping {sum(duplicates.values())} duplicate ticket ID rows: "
+                f"{', '.join(duplicates)}"
+            )
+            ticket_ids = unique_ticket_ids
+
         self.logger.info(f"Loaded {len(ticket_ids)} ticket IDs from {csv_path}")
         return ticket_ids
 
-    async def fetch_phase(self, ticket_ids: List[Tuple[int, str]]) -> List[dict]:
+    async def fetch_and_synthesis_phase(self, ticket_ids: List[Tuple[int, str]]) -> List[dict]:
         """
-        Phase 1: Fetch all tickets from Zendesk.
+        Phase 1 + 2: Fetch tickets from Zendesk and synthesize them with the LLM, pipelined.
+
+        Each ticket is handed to the synthesizer as soon as its fetch completes, so
+        Zendesk fetches and LLM synthesis overlap instead of running back to back.
 
         Args:
             ticket_ids: List of tuples (serial_no, ticket_id)
 
         Returns:
-            List of fetched ticket dictionaries
+            List of synthesized ticket dictionaries (failed fetches last)
         """
         self.console.print("\n[bold cyan][PHASE 1] Fetching Ticket Data from Zendesk[/bold cyan]")
+        self.console.print("[bold cyan][PHASE 2] Synthesizing with Gemini 2.5 Pro (as tickets arrive)[/bold cyan]")
 
-        fetched_tickets = []
         fetch_errors = []
 
-        # Progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(
-                "[cyan]Fetching tickets...",
-                total=len(ticket_ids)
-            )
+        # Progress tracking - synthesis total shrinks as fetches fail
+        progress = self.progress
+        fetch_task = progress.add_task(
+            "[cyan]Fetching tickets...",
+            total=len(ticket_ids)
+        )
+        synthesis_task = progress.add_task(
+            "[cyan]Synthesizing tickets...",
+            total=len(ticket_ids)
+        )
+        synthesis_total = len(ticket_ids)
 
-            def progress_callback(ticket_id: str, result: dict):
-                """Callback for progress updates."""
-                if result.get('processing_status') == 'success':
-                    self.stats['fetch_success'] += 1
-                else:
-                    self.stats['fetch_failed'] += 1
-                    fetch_errors.append(result)
+        def fetch_callback(ticket_id: str, result: dict):
+            """Callback for fetch progress updates."""
+            nonlocal synthesis_total
+            if result.get('processing_status') == 'success':
+                self.stats['fetch_success'] += 1
+            else:
+                self.stats['fetch_failed'] += 1
+                fetch_errors.append(result)
+                synthesis_total -= 1
+                progress.update(synthesis_task, total=synthesis_total)
 
-                progress.update(task, advance=1)
+            progress.update(fetch_task, advance=1)
 
-            # Fetch all tickets
-            fetched_tickets = await self.fetcher.fetch_multiple_tickets(
-                ticket_ids,
-                progress_callback
-            )
+        def synthesis_callback(ticket_id: str, result: dict, success: bool):
+            """Callback for synthesis progress updates."""
+            if success:
+                self.stats['synthesis_success'] += 1
+            else:
+                self.stats['synthesis_failed'] += 1
+
+            progress.update(synthesis_task, advance=1)
+
+        # Tickets arrive in completion order - restore CSV order for the output
+        input_order = {
+            (serial_no, ticket_id): index
+            for index, (serial_no, ticket_id) in enumerate(ticket_ids)
+        }
+
+        synthesized_tickets = await self.synthesizer.synthesize_stream(
+            self.fetcher.iter_tickets(ticket_ids, fetch_callback),
+            synthesis_callback,
+            order_key=lambda t: input_order.get((t.get('serial_no'), t.get('ticket_id')), 0)
+        )
 
         # Display results
         self.console.print(
@@ -201,68 +353,22 @@ class TicketSummarizer:
                 f"(IDs: {', '.join(failed_ids)})"
             )
 
-        return fetched_tickets
-
-    async def synthesis_phase(self, tickets: List[dict]) -> List[dict]:
-        """
-        Phase 2: Synthesize tickets using Gemini LLM.
-
-        Args:
-            tickets: List of fetched ticket dictionaries
-
-        Returns:
-            List of synthesized ticket dictionaries
-        """
-        self.console.print("\n[bold cyan][PHASE 2] Synthesizing with Gemini 2.5 Pro[/bold cyan]")
-
-        # Filter tickets that were successfully fetched
-        tickets_to_synthesize = [
-            t for t in tickets
-            if t.get('processing_status') == 'success'
-        ]
-
-        if not tickets_to_synthesize:
+        if self.stats['fetch_success'] == 0:
             self.console.print("[yellow]⚠[/yellow] No tickets to synthesize (all fetches failed)")
-            return tickets
-
-        synthesized_tickets = []
-
-        # Progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(
-                "[cyan]Synthesizing tickets...",
-                total=len(tickets_to_synthesize)
-            )
-
-            def progress_callback(ticket_id: str, result: dict, success: bool):
-                """Callback for progress updates."""
-                if success:
-                    self.stats['synthesis_success'] += 1
-                else:
-                    self.stats['synthesis_failed'] += 1
-
-                progress.update(task, advance=1)
-
-            # Synthesize all tickets
-            synthesized_tickets = await self.synthesizer.synthesize_multiple(
-                tickets,
-                progress_callback
-            )
-
-        # Display results
-        self.console.print(
-            f"[green]✓[/green] Successfully synthesized: {self.stats['synthesis_success']} tickets"
-        )
-        if self.stats['synthesis_failed'] > 0:
+        else:
             self.console.print(
-                f"[red]✗[/red] Failed: {self.stats['synthesis_failed']} tickets"
+                f"[green]✓[/green] Successfully synthesized: {self.stats['synthesis_success']} tickets"
             )
+            if self.stats['synthesis_failed'] > 0:
+                self.console.print(
+                    f"[red]✗[/red] Failed: {self.stats['synthesis_failed']} tickets"
+                )
+
+        # Single pass to index tickets eligible for Phase 3 analysis
+        self._synthesized_idx = [
+            i for i, t in enumerate(synthesized_tickets)
+            if t.get('processing_status') == 'success' and 'synthesis' in t
+        ]
 
         return synthesized_tickets
 
@@ -282,12 +388,8 @@ class TicketSummarizer:
         """
         self.console.print("\n[bold cyan][PHASE 3] Categorizing into PODs[/bold cyan]")
 
-        # Filter tickets that were successfully synthesized
-        # Only categorize tickets with synthesis data
-        tickets_to_categorize = [
-            t for t in tickets
-            if t.get('processing_status') == 'success' and 'synthesis' in t
-        ]
+        # Tickets with synthesis data (indexed once by fetch_and_synthesis_phase)
+        tickets_to_categorize = [tickets[i] for i in self._synthesized_idx]
 
         if not tickets_to_categorize:
             self.console.print("[yellow]⚠[/yellow] No tickets to categorize (all synthesis failed)")
@@ -296,59 +398,54 @@ class TicketSummarizer:
         categorized_tickets = []
 
         # Progress tracking with real-time updates
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(
-                "[cyan]Categorizing tickets...",
-                total=len(tickets_to_categorize)
-            )
+        progress = self.progress
+        task = progress.add_task(
+            "[cyan]Categorizing tickets...",
+            total=len(tickets_to_categorize)
+        )
 
-            def progress_callback(ticket_id: str, result: dict, success: bool):
-                """
-                Callback for progress updates during categorization.
-
-                Tracks:
-                - Success/failure counts
-                - Confidence breakdown (confident vs not confident)
-                - POD distribution
-                """
-                if success:
-                    self.stats['categorization_success'] += 1
-
-                    # Track confidence breakdown
-                    categorization = result.get('categorization', {})
-                    confidence = categorization.get('confidence', '')
-
-                    if confidence == 'confident':
-                        self.stats['confident_count'] += 1
-                    elif confidence == 'not confident':
-                        self.stats['not_confident_count'] += 1
-
-                    # Track POD distribution
-                    primary_pod = categorization.get('primary_pod', 'Unknown')
-                    if primary_pod:
-                        self.stats['pod_distribution'][primary_pod] = \
-                            self.stats['pod_distribution'].get(primary_pod, 0) + 1
-
-                    # Track escalation (Phase 5)
-                    escalation = result.get('custom_fields', {}).get('escalation', {})
-                    if escalation.get('is_escalated', False):
-                        self.stats['escalated_count'] += 1
-                else:
-                    self.stats['categorization_failed'] += 1
-
-                progress.update(task, advance=1)
-
-            # Categorize all tickets in parallel with rate limiting
-            categorized_tickets = await self.categorizer.categorize_multiple(
-                tickets,
-                progress_callback
-            )
+        # Bind stats containers once; the callback runs once per ticket
+        stats = self.stats
+        pod_distribution = stats['pod_distribution']
+
+        def progress_callback(ticket_id: str, result: dict, success: bool):
+            """
+            Callback for progress updates during categorization.
+
+            Tracks:
+            - Success/failure counts
+            - Confidence breakdown (confident vs not confident)
+            - POD distribution
+            """
+            if success:
+                stats['categorization_success'] += 1
+
+                # Track confidence breakdown
+                categorization = result.get('categorization', {})
+                confidence_key = _CATEGORIZATION_CONFIDENCE_STATS.get(
+                    categorization.get('confidence', '')
+                )
+                if confidence_key:
+                    stats[confidence_key] += 1
+
+                # Track POD distribution
+                primary_pod = categorization.get('primary_pod', 'Unknown')
+                if primary_pod:
+                    pod_distribution[primary_pod] += 1
+
+                # Track escalation (Phase 5)
+                if utils.is_escalated(result):
+                    stats['escalated_count'] += 1
+            else:
+                stats['categorization_failed'] += 1
+
+            progress.update(task, advance=1)
+
+        # Categorize all tickets in parallel with rate limiting
+        categorized_tickets = await self.categorizer.categorize_multiple(
+            tickets,
+            progress_callback
+        )
 
         # Display categorization results
         self.console.print(
@@ -384,12 +481,8 @@ class TicketSummarizer:
         """
         self.console.print("\n[bold cyan][PHASE 3b] Analyzing Diagnostics Applicability[/bold cyan]")
 
-        # Filter tickets that were successfully synthesized
-        # Only analyze tickets with synthesis data
-        tickets_to_analyze = [
-            t for t in tickets
-            if t.get('processing_status') == 'success' and 'synthesis' in t
-        ]
+        # Tickets with synthesis data (indexed once by fetch_and_synthesis_phase)
+        tickets_to_analyze = [tickets[i] for i in self._synthesized_idx]
 
         if not tickets_to_analyze:
             self.console.print("[yellow]⚠[/yellow] No tickets to analyze (all synthesis failed)")
@@ -398,68 +491,67 @@ class TicketSummarizer:
         analyzed_tickets = []
 
         # Progress tracking with real-time updates
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(
-                "[cyan]Analyzing Diagnostics applicability...",
-                total=len(tickets_to_analyze)
-            )
+        progress = self.progress
+        task = progress.add_task(
+            "[cyan]Analyzing Diagnostics applicability...",
+            total=len(tickets_to_analyze)
+        )
 
-            def progress_callback(ticket_id: str, result: dict):
-                """
-                Callback for progress updates during diagnostics analysis.
-
-                Tracks:
-                - Success/failure counts
-                - "Was Diagnostics used?" breakdown
-                - "Could Diagnostics help?" breakdown
-                - Confidence breakdown
-                """
-                if result.get('diagnostics_analysis_status') == 'success':
-                    self.stats['diagnostics_analysis_success'] += 1
-
-                    # Get diagnostics analysis data
-                    diag_analysis = result.get('diagnostics_analysis', {})
-
-                    # Track "was_diagnostics_used" breakdown
-                    was_used = diag_analysis.get('was_diagnostics_used', {})
-                    llm_assessment = was_used.get('llm_assessment', '').lower()
-                    if llm_assessment in ['yes', 'no', 'unknown']:
-                        self.stats['diagnostics_was_used'][llm_assessment] += 1
-
-                    # Track "could_diagnostics_help" breakdown
-                    could_help = diag_analysis.get('could_diagnostics_help', {})
-                    assessment = could_help.get('assessment', '').lower()
-                    if assessment in ['yes', 'no', 'maybe']:
-                        self.stats['diagnostics_could_help'][assessment] += 1
-
-                    # Track confidence (using could_diagnostics_help confidence)
-                    confidence = could_help.get('confidence', '').lower()
-                    if confidence == 'confident':
-                        self.stats['diagnostics_confidence']['confident'] += 1
-                    elif confidence == 'not confident':
-                        self.stats['diagnostics_confidence']['not_confident'] += 1
-
-                    # Track escalation (Phase 5)
-                    escalation = result.get('custom_fields', {}).get('escalation', {})
-                    if escalation.get('is_escalated', False):
-                        self.stats['escalated_count'] += 1
-
-                else:
-                    self.stats['diagnostics_analysis_failed'] += 1
-
-                progress.update(task, advance=1)
-
-            # Analyze all tickets with rate limiting
-            analyzed_tickets = await self.diagnostics_analyzer.analyze_multiple(
-                tickets,
-                progress_callback
-            )
+        # Bind stats containers once; the callback runs once per ticket
+        stats = self.stats
+        was_used_counts = stats['diagnostics_was_used']
+        could_help_counts = stats['diagnostics_could_help']
+        confidence_counts = stats['diagnostics_confidence']
+
+        def progress_callback(ticket_id: str, result: dict):
+            """
+            Callback for progress updates during diagnostics analysis.
+
+            Tracks:
+            - Success/failure counts
+            - "Was Diagnostics used?" breakdown
+            - "Could Diagnostics help?" breakdown
+            - Confidence breakdown
+            """
+            if result.get('diagnostics_analysis_status') == 'success':
+                stats['diagnostics_analysis_success'] += 1
+
+                # Get diagnostics analysis data
+                diag_analysis = result.get('diagnostics_analysis', {})
+
+                # Track "was_diagnostics_used" breakdown
+                was_used = diag_analysis.get('was_diagnostics_used', {})
+                llm_assessment = was_used.get('llm_assessment', '').lower()
+                if llm_assessment in was_used_counts:
+                    was_used_counts[llm_assessment] += 1
+
+                # Track "could_diagnostics_help" breakdown
+                could_help = diag_analysis.get('could_diagnostics_help', {})
+                assessment = could_help.get('assessment', '').lower()
+                if assessment in could_help_counts:
+                    could_help_counts[assessment] += 1
+
+                # Track confidence (using could_diagnostics_help confidence)
+                confidence_key = _DIAGNOSTICS_CONFIDENCE_STATS.get(
+                    could_help.get('confidence', '').lower()
+                )
+                if confidence_key:
+                    confidence_counts[confidence_key] += 1
+
+                # Track escalation (Phase 5)
+                if utils.is_escalated(result):
+                    stats['escalated_count'] += 1
+
+            else:
+                stats['diagnostics_analysis_failed'] += 1
+
+            progress.update(task, advance=1)
+
+        # Analyze all tickets with rate limiting
+        analyzed_tickets = await self.diagnostics_analyzer.analyze_multiple(
+            tickets,
+            progress_callback
+        )
 
         # Display diagnostics analysis results
         self.console.print(
@@ -502,16 +594,24 @@ class TicketSummarizer:
         # Calculate processing time
         processing_time = self.stats['end_time'] - self.stats['start_time']
 
-        # Calculate escalation statistics (Phase 5)
-        escalated_count = sum(
-            1 for ticket in tickets
-            if ticket.get("processing_status") == "success"
-            and ticket.get("custom_fields", {}).get("escalation", {}).get("is_escalated", False)
-        )
-        successful_count = sum(
-            1 for ticket in tickets
-            if ticket.get("processing_status") == "success"
-        )
+        # Collect tickets, errors and escalation statistics (Phase 5) in one pass
+        errors = []
+        escalated_count = successful_count = 0
+        for ticket in tickets:
+            if ticket.get('processing_status') == 'success':
+                successful_count += 1
+                if utils.is_escalated(ticket):
+                    escalated_count += 1
+                if 'synthesis' in ticket:
+                    continue
+            # Failed ticket
+            errors.append({
+                "ticket_id": ticket.get('ticket_id'),
+                "serial_no": ticket.get('serial_no'),
+                "error_type": ticket.get('error_type', 'UnknownError'),
+                "message": ticket.get('error', 'Unknown error occurred')
+            })
+
         escalation_rate = (escalated_count / successful_count * 100) if successful_count > 0 else 0
 
         # Build metadata based on analysis type
@@ -532,14 +632,7 @@ class TicketSummarizer:
                     "confident": self.stats['confident_count'],
                     "not_confident": self.stats['not_confident_count']
                 },
-                "pod_distribution": self.stats['pod_distribution'],
-                "escalation_breakdown": {
-                    "total_escalated": escalated_count,
-                    "total_not_escalated": successful_count - escalated_count,
-                    "escalation_rate": f"{escalation_rate:.2f}%"
-                },
-                "processed_at": utils.get_current_ist_timestamp(),
-                "processing_time_seconds": round(processing_time, 2)
+                "pod_distribution": self.stats['pod_distribution']
             }
         elif self.analysis_type == "diagnostics":
             # Diagnostics analysis metadata
@@ -558,14 +651,7 @@ class TicketSummarizer:
                     "was_used": self.stats['diagnostics_was_used'],
                     "could_help": self.stats['diagnostics_could_help'],
                     "confidence": self.stats['diagnostics_confidence']
-                },
-                "escalation_breakdown": {
-                    "total_escalated": escalated_count,
-                    "total_not_escalated": successful_count - escalated_count,
-                    "escalation_rate": f"{escalation_rate:.2f}%"
-                },
-                "processed_at": utils.get_current_ist_timestamp(),
-                "processing_time_seconds": round(processing_time, 2)
+                }
             }
         else:  # both
             # Combined metadata
@@ -595,83 +681,126 @@ class TicketSummarizer:
                     "was_used": self.stats['diagnostics_was_used'],
                     "could_help": self.stats['diagnostics_could_help'],
                     "confidence": self.stats['diagnostics_confidence']
-                },
-                "escalation_breakdown": {
-                    "total_escalated": escalated_count,
-                    "total_not_escalated": successful_count - escalated_count,
-                    "escalation_rate": f"{escalation_rate:.2f}%"
-                },
-                "processed_at": utils.get_current_ist_timestamp(),
-                "processing_time_seconds": round(processing_time, 2)
+                }
             }
 
+        # Fields shared by every analysis type
+        metadata["escalation_breakdown"] = {
+            "total_escalated": escalated_count,
+            "total_not_escalated": successful_count - escalated_count,
+            "escalation_rate": f"{escalation_rate:.2f}%"
+        }
+        metadata["processed_at"] = utils.get_current_ist_timestamp()
+        metadata["processing_time_seconds"] = round(processing_time, 2)
+
         output = {
             "metadata": metadata,
-            "tickets": [],
-            "errors": []
+            "tickets": list(tickets),
+            "errors": errors
         }
 
-        # Process tickets
-        for ticket in tickets:
-            if ticket.get('processing_status') == 'success' and 'synthesis' in ticket:
-                # Successfully processed ticket
-                output["tickets"].append(ticket)
-            else:
-                # Failed ticket
-                output["tickets"].append(ticket)
-                output["errors"].append({
-                    "ticket_id": ticket.get('ticket_id'),
-                    "serial_no": ticket.get('serial_no'),
-                    "error_type": ticket.get('error_type', 'UnknownError'),
-                    "message": ticket.get('error', 'Unknown error occurred')
-                })
-
         return output
 
-    def save_output(self, output: dict, analysis_type: str = None) -> str:
+    @staticmethod
+    def _serialize_output_body(output: dict) -> bytes:
+        """
+        Serialize everything in the output except its metadata.
+
+        Args:
+            output: Output dictionary
+
+        Returns:
+            Indented JSON bytes for the non-metadata keys (tickets, errors)
+        """
+        return orjson.dumps(
+            {key: value for key, value in output.items() if key != "metadata"},
+            option=_JSON_OPTIONS
+        )
+
+    @staticmethod
+    def _write_output_json(filename: str, metadata: dict, body: bytes) -> None:
+        """
+        Write an output JSON file from its metadata and a pre-serialized body.
+
+        Args:
+            filename: Output JSON path
+            metadata: Metadata dictionary for this file
+            body: Bytes from _serialize_output_body()
+        """
+        header = orjson.dumps({"metadata": metadata}, option=_JSON_OPTIONS)
+        # Splice the two objects: drop the header's closing "\n}" and the body's opening "{"
+        Path(filename).write_bytes(header[:-2] + b"," + body[1:])
+
+    def get_output_filenames(self, analysis_type: str = None) -> List[str]:
+        """
+        Build timestamped output JSON filenames for an analysis type.
+
+        Args:
+            analysis_type: Type of analysis ("pod", "diagnostics", "both")
+
+        Returns:
+            List of JSON filenames (two for "both": POD first, then diagnostics)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        analysis_suffix = analysis_type or self.analysis_type
+
+        if analysis_suffix == "both":
+            return [f"output_pod_{timestamp}.json", f"output_diagnostics_{timestamp}.json"]
+        return [f"output_{analysis_suffix}_{timestamp}.json"]
+
+    def save_output(
+        self,
+        output: dict,
+        analysis_type: str = None,
+        filenames: Optional[List[str]] = None
+    ) -> str:
         """
         Save output to JSON file with analysis-type-specific naming.
 
         Args:
             output: Output dictionary to save
             analysis_type: Type of analysis ("pod", "diagnostics", "both")
+            filenames: Precomputed names from get_output_filenames() (optional)
 
         Returns:
             Output filename
         """
-        # Generate timestamped filename based on analysis type
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         analysis_suffix = analysis_type or self.analysis_type
+        filenames = filenames or self.get_output_filenames(analysis_suffix)
 
         if analysis_suffix == "both":
             # For "both", generate two separate files
-            pod_filename = f"output_pod_{timestamp}.json"
-            diagnostics_filename = f"output_diagnostics_{timestamp}.json"
-
-            # Create POD-specific output
-            pod_output = output.copy()
-            pod_output["metadata"]["analysis_type"] = "pod"
+            pod_filename, diagnostics_filename = filenames
 
-            # Create Diagnostics-specific output
-            diag_output = output.copy()
-            diag_output["metadata"]["analysis_type"] = "diagnostics"
+            # Per-file metadata; a shallow output.copy() would share (and mutate) one metadata dict
+            pod_metadata = {**output["metadata"], "analysis_type": "pod"}
+            diag_metadata = {**output["metadata"], "analysis_type": "diagnostics"}
 
-            # Save both JSON files
-            with open(pod_filename, 'w', encoding='utf-8') as f:
-                json.dump(pod_output, f, indent=2, ensure_ascii=False)
-            with open(diagnostics_filename, 'w', encoding='utf-8') as f:
-                json.dump(diag_output, f, indent=2, ensure_ascii=False)
+            # Save both JSON files (tickets/errors are shared, so serialize them once)
+            body = self._serialize_output_body(output)
+            self._write_output_json(pod_filename, pod_metadata, body)
+            self._write_output_json(diagnostics_filename, diag_metadata, body)
 
             self.logger.info(f"POD output saved to {pod_filename}")
             self.logger.info(f"Diagnostics output saved to {diagnostics_filename}")
 
             # Generate CSV files (Phase 5)
-            csv_exporter = CSVExporter()
+            csv_exporter = self.csv_exporter
             pod_csv_filename = pod_filename.replace(".json", ".csv")
             diagnostics_csv_filename = diagnostics_filename.replace(".json", ".csv")
 
-            csv_exporter.export_pod_categorization(output["tickets"], pod_csv_filename)
-            csv_exporter.export_diagnostics_analysis(output["tickets"], diagnostics_csv_filename)
+            # The two exports are independent, so their file writes overlap
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                exports = [
+                    executor.submit(
+                        csv_exporter.export_pod_categorization, output["tickets"], pod_csv_filename
+                    ),
+                    executor.submit(
+                        csv_exporter.export_diagnostics_analysis, output["tickets"], diagnostics_csv_filename
+                    )
+                ]
+                for export in exports:
+                    export.result()
 
             self.logger.info(f"POD CSV saved to {pod_csv_filename}")
             self.logger.info(f"Diagnostics CSV saved to {diagnostics_csv_filename}")
@@ -679,15 +808,16 @@ class TicketSummarizer:
             return f"{pod_filename}, {diagnostics_filename}"
         else:
             # Single file for pod or diagnostics
-            filename = f"output_{analysis_suffix}_{timestamp}.json"
+            filename = filenames[0]
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
+            self._write_output_json(
+                filename, output["metadata"], self._serialize_output_body(output)
+            )
 
             self.logger.info(f"Output saved to {filename}")
 
             # Generate CSV file (Phase 5)
-            csv_exporter = CSVExporter()
+            csv_exporter = self.csv_exporter
             csv_filename = filename.replace(".json", ".csv")
 
             if analysis_suffix == "pod":
@@ -699,7 +829,45 @@ class TicketSummarizer:
 
             return filename
 
-    def display_summary(self, output_filename: str):
+    def _add_summary_rows(self, table: Table, section: str) -> None:
+        """
+        Add one _SUMMARY_ROWS breakdown section to the summary table.
+
+        Args:
+            table: Summary table
+            section: Key into _SUMMARY_ROWS
+        """
+        for label, path, style in _SUMMARY_ROWS[section]:
+            table.add_row(label, Text(str(reduce(operator.getitem, path, self.stats)), style=style))
+
+    def _add_pod_distribution_rows(self, table: Table) -> None:
+        """
+        Add one row per POD (sorted by name) to the summary table.
+
+        Args:
+            table: Summary table
+        """
+        for pod, count in sorted(self.stats['pod_distribution'].items()):
+            table.add_row(f"  • {pod}:", str(count))
+
+    def _add_escalation_rows(self, table: Table, processed: int) -> None:
+        """
+        Add the escalation summary (Phase 5) to the summary table.
+
+        Args:
+            table: Summary table
+            processed: Successfully processed ticket count (rate denominator)
+        """
+        escalated = self.stats.get('escalated_count', 0)
+        escalation_rate = (escalated / processed * 100) if processed > 0 else 0
+        table.add_row("Escalation Summary:", "")
+        table.add_row(
+            "  • Escalated to Engineering:",
+            Text.assemble((str(escalated), "yellow"), f" ({escalation_rate:.2f}%)")
+        )
+        table.add_row("  • Not Escalated:", Text(str(processed - escalated), style="green"))
+
+    def display_summary(self):
         """
         Display final summary to console based on analysis type.
 
@@ -709,167 +877,84 @@ class TicketSummarizer:
         - Processing time
         - Log file location
 
-        Args:
-            output_filename: Name of the output file(s)
+        The "Output saved" footer is printed separately by display_output_saved(),
+        once the output files have actually been written.
         """
-        processing_time = self.stats['end_time'] - self.stats['start_time']
-        minutes = int(processing_time // 60)
-        seconds = int(processing_time % 60)
+        stats = self.stats
+        processing_time = stats['end_time'] - stats['start_time']
+        minutes, seconds = divmod(int(processing_time), 60)
 
-        # Create summary table
+        # Create summary table (coloured cells are Text objects, so Rich skips markup parsing)
         table = Table(title="Summary", show_header=False, box=None)
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
 
         table.add_row("Analysis Type:", self.analysis_type.upper())
-        table.add_row("Total Tickets:", str(self.stats['total_tickets']))
+        table.add_row("Total Tickets:", str(stats['total_tickets']))
 
+        # Success/failure counts for the phases this analysis type ran
         if self.analysis_type == "pod":
-            # POD categorization summary
-            table.add_row(
-                "Successfully Processed:",
-                f"[green]{self.stats['categorization_success']}[/green]"
-            )
-            table.add_row(
-                "Failed:",
-                f"[red]{self.stats['fetch_failed'] + self.stats['synthesis_failed'] + self.stats['categorization_failed']}[/red]"
-            )
+            processed = stats['categorization_success']
+            analysis_failed = stats['categorization_failed']
+        elif self.analysis_type == "diagnostics":
+            processed = stats['diagnostics_analysis_success']
+            analysis_failed = stats['diagnostics_analysis_failed']
+        else:  # both
+            processed = min(stats['categorization_success'], stats['diagnostics_analysis_success'])
+            analysis_failed = max(stats['categorization_failed'], stats['diagnostics_analysis_failed'])
+        failed = stats['fetch_failed'] + stats['synthesis_failed'] + analysis_failed
+
+        table.add_row("Successfully Processed:", Text(str(processed), style="green"))
+        table.add_row("Failed:", Text(str(failed), style="red"))
 
+        if self.analysis_type == "pod":
             # Confidence breakdown
-            if self.stats['confident_count'] > 0 or self.stats['not_confident_count'] > 0:
+            if stats['confident_count'] > 0 or stats['not_confident_count'] > 0:
                 table.add_row("Confidence Breakdown:", "")
-                table.add_row(
-                    "  • Confident:",
-                    f"[green]{self.stats['confident_count']}[/green]"
-                )
-                table.add_row(
-                    "  • Not Confident:",
-                    f"[yellow]{self.stats['not_confident_count']}[/yellow]"
-                )
+                self._add_summary_rows(table, "pod_confidence")
 
             # POD distribution
-            if self.stats['pod_distribution']:
+            if stats['pod_distribution']:
                 table.add_row("POD Distribution:", "")
-                for pod, count in sorted(self.stats['pod_distribution'].items()):
-                    table.add_row(f"  • {pod}:", str(count))
-
-            # Escalation summary (Phase 5)
-            escalated = self.stats.get('escalated_count', 0)
-            not_escalated = self.stats['categorization_success'] - escalated
-            escalation_rate = (escalated / self.stats['categorization_success'] * 100) if self.stats['categorization_success'] > 0 else 0
-            table.add_row("Escalation Summary:", "")
-            table.add_row(
-                "  • Escalated to Engineering:",
-                f"[yellow]{escalated}[/yellow] ({escalation_rate:.2f}%)"
-            )
-            table.add_row(
-                "  • Not Escalated:",
-                f"[green]{not_escalated}[/green]"
-            )
-
-        elif self.analysis_type == "diagnostics":
-            # Diagnostics analysis summary
-            table.add_row(
-                "Successfully Processed:",
-                f"[green]{self.stats['diagnostics_analysis_success']}[/green]"
-            )
-            table.add_row(
-                "Failed:",
-                f"[red]{self.stats['fetch_failed'] + self.stats['synthesis_failed'] + self.stats['diagnostics_analysis_failed']}[/red]"
-            )
-
-            # Was Diagnostics Used breakdown
-            if any(self.stats['diagnostics_was_used'].values()):
-                table.add_row("Was Diagnostics Used?", "")
-                table.add_row(
-                    "  • Yes:",
-                    f"[green]{self.stats['diagnostics_was_used']['yes']}[/green]"
-                )
-                table.add_row(
-                    "  • No:",
-                    f"[red]{self.stats['diagnostics_was_used']['no']}[/red]"
-                )
-                table.add_row(
-                    "  • Unknown:",
-                    f"[yellow]{self.stats['diagnostics_was_used']['unknown']}[/yellow]"
-                )
-
-            # Could Diagnostics Help breakdown
-            if any(self.stats['diagnostics_could_help'].values()):
-                table.add_row("Could Diagnostics Help?", "")
-                table.add_row(
-                    "  • Yes:",
-                    f"[green]{self.stats['diagnostics_could_help']['yes']}[/green]"
-                )
-                table.add_row(
-                    "  • No:",
-                    f"[red]{self.stats['diagnostics_could_help']['no']}[/red]"
-                )
-                table.add_row(
-                    "  • Maybe:",
-                    f"[yellow]{self.stats['diagnostics_could_help']['maybe']}[/yellow]"
-                )
+                self._add_pod_distribution_rows(table)
 
-            # Confidence breakdown
-            if any(self.stats['diagnostics_confidence'].values()):
-                table.add_row("Confidence:", "")
-                table.add_row(
-                    "  • Confident:",
-                    f"[green]{self.stats['diagnostics_confidence']['confident']}[/green]"
-                )
-                table.add_row(
-                    "  • Not Confident:",
-                    f"[yellow]{self.stats['diagnostics_confidence']['not_confident']}[/yellow]"
-                )
+            self._add_escalation_rows(table, processed)
 
-            # Escalation summary (Phase 5)
-            escalated = self.stats.get('escalated_count', 0)
-            not_escalated = self.stats['diagnostics_analysis_success'] - escalated
-            escalation_rate = (escalated / self.stats['diagnostics_analysis_success'] * 100) if self.stats['diagnostics_analysis_success'] > 0 else 0
-            table.add_row("Escalation Summary:", "")
-            table.add_row(
-                "  • Escalated to Engineering:",
-                f"[yellow]{escalated}[/yellow] ({escalation_rate:.2f}%)"
-            )
-            table.add_row(
-                "  • Not Escalated:",
-                f"[green]{not_escalated}[/green]"
-            )
+        elif self.analysis_type == "diagnostics":
+            # Was Diagnostics Used / Could Diagnostics Help / Confidence breakdowns
+            for title, counts_key in (
+                ("Was Diagnostics Used?", "diagnostics_was_used"),
+                ("Could Diagnostics Help?", "diagnostics_could_help"),
+                ("Confidence:", "diagnostics_confidence"),
+            ):
+                if any(stats[counts_key].values()):
+                    table.add_row(title, "")
+                    self._add_summary_rows(table, counts_key)
+
+            self._add_escalation_rows(table, processed)
 
         else:  # both
-            # Combined summary
-            table.add_row(
-                "Successfully Processed:",
-                f"[green]{min(self.stats['categorization_success'], self.stats['diagnostics_analysis_success'])}[/green]"
-            )
-            table.add_row(
-                "Failed:",
-                f"[red]{self.stats['fetch_failed'] + self.stats['synthesis_failed'] + max(self.stats['categorization_failed'], self.stats['diagnostics_analysis_failed'])}[/red]"
-            )
-
             # POD stats
             table.add_row("POD Analysis:", "")
-            if self.stats['pod_distribution']:
-                for pod, count in sorted(self.stats['pod_distribution'].items()):
-                    table.add_row(f"  • {pod}:", str(count))
+            self._add_pod_distribution_rows(table)
 
             # Diagnostics stats
             table.add_row("Diagnostics Analysis:", "")
-            table.add_row(
-                "  • Could Help (Yes):",
-                f"[green]{self.stats['diagnostics_could_help']['yes']}[/green]"
-            )
-            table.add_row(
-                "  • Could Help (No):",
-                f"[red]{self.stats['diagnostics_could_help']['no']}[/red]"
-            )
+            self._add_summary_rows(table, "both_could_help")
 
         table.add_row("Total Time:", f"{minutes}m {seconds}s")
-        table.add_row("Log File:", f"logs/app_{datetime.now().strftime('%Y%m%d')}.log")
+        table.add_row("Log File:", self.log_filepath)
+
+        # Display in panel (one console write for spacing and panel)
+        self.console.print(Group(Text("\n"), Panel(table, border_style="green")))
+
+    def display_output_saved(self, output_filename: str):
+        """
+        Display the output file footer after the files are written.
 
-        # Display in panel
-        self.console.print("\n")
-        self.console.print(Panel(table, border_style="green"))
+        Args:
+            output_filename: Name of the output file(s)
+        """
         self.console.print(f"\n[green]✓[/green] Output saved: [bold]{output_filename}[/bold]\n")
 
     async def run(self, csv_path: str):
@@ -894,7 +979,7 @@ class TicketSummarizer:
             self.console.print(f"[bold cyan]Model Provider:[/bold cyan] {self.model_provider.upper()}")
 
             # Start timer
-            self.stats['start_time'] = time.time()
+            self.stats['start_time'] = time.perf_counter()
 
             # Load CSV
             self.console.print(f"[cyan]Loading CSV:[/cyan] {csv_path}")
@@ -902,65 +987,66 @@ class TicketSummarizer:
             self.stats['total_tickets'] = len(ticket_ids)
             self.console.print(f"[green]✓[/green] Found {len(ticket_ids)} tickets to process")
 
-            # Phase 1: Fetch tickets from Zendesk (with custom fields)
-            fetched_tickets = await self.fetch_phase(ticket_ids)
-
-            # Phase 2: Synthesize tickets using Gemini LLM
-            synthesized_tickets = await self.synthesis_phase(fetched_tickets)
-
-            # Phase 3: Branch based on analysis type
-            processed_tickets = synthesized_tickets
-
-            if self.analysis_type == "pod":
-                # Phase 3a: POD categorization only
-                processed_tickets = await self.categorization_phase(synthesized_tickets)
-
-            elif self.analysis_type == "diagnostics":
-                # Phase 3b: Diagnostics analysis only
-                processed_tickets = await self.diagnostics_phase(synthesized_tickets)
-
-            elif self.analysis_type == "both":
-                # Phase 3a + 3b: Run both analyses in parallel
-                self.console.print(
-                    "\n[bold cyan][PHASE 3] Running POD Categorization + Diagnostics Analysis in Parallel[/bold cyan]"
-                )
-
-                # Create tasks for parallel execution
-                pod_task = asyncio.create_task(
-                    self.categorization_phase(synthesized_tickets)
-                )
-                diag_task = asyncio.create_task(
-                    self.diagnostics_phase(synthesized_tickets)
-                )
-
-                # Wait for both to complete
-                categorized_tickets, diagnostics_tickets = await asyncio.gather(
-                    pod_task, diag_task
-                )
-
-                # Merge results (both should have same tickets, just different analysis fields)
-                # We'll use the categorized_tickets as base and merge diagnostics analysis
-                for i, ticket in enumerate(categorized_tickets):
-                    if i < len(diagnostics_tickets):
-                        diag_ticket = diagnostics_tickets[i]
-                        if 'diagnostics_analysis' in diag_ticket:
-                            ticket['diagnostics_analysis'] = diag_ticket['diagnostics_analysis']
-                        if 'diagnostics_analysis_status' in diag_ticket:
-                            ticket['diagnostics_analysis_status'] = diag_ticket['diagnostics_analysis_status']
-
-                processed_tickets = categorized_tickets
+            # All phases report into one long-lived progress display
+            with self.progress:
+                # Phase 1 + 2: Fetch tickets from Zendesk (with custom fields) and
+                # synthesize each one with the LLM as soon as it arrives
+                synthesized_tickets = await self.fetch_and_synthesis_phase(ticket_ids)
+
+                # Phase 3: Branch based on analysis type
+                processed_tickets = synthesized_tickets
+
+                if self.analysis_type == "pod":
+                    # Phase 3a: POD categorization only
+                    processed_tickets = await self.categorization_phase(synthesized_tickets)
+
+                elif self.analysis_type == "diagnostics":
+                    # Phase 3b: Diagnostics analysis only
+                    processed_tickets = await self.diagnostics_phase(synthesized_tickets)
+
+                elif self.analysis_type == "both":
+                    # Phase 3a + 3b: Run both analyses in parallel
+                    self.console.print(
+                        "\n[bold cyan][PHASE 3] Running POD Categorization + Diagnostics Analysis in Parallel[/bold cyan]"
+                    )
+
+                    # Both phases add their task to the shared progress display
+                    categorized_tickets, diagnostics_tickets = await asyncio.gather(
+                        self.categorization_phase(synthesized_tickets),
+                        self.diagnostics_phase(synthesized_tickets)
+                    )
+
+                    # Merge results by ticket_id - the two phases return tickets in
+                    # different orders (categorization appends skipped tickets last);
+                    # load_csv() guarantees ticket IDs are unique
+                    diagnostics_by_id = {t.get('ticket_id'): t for t in diagnostics_tickets}
+                    for ticket in categorized_tickets:
+                        diag_ticket = diagnostics_by_id.get(ticket.get('ticket_id'))
+                        if diag_ticket is None:
+                            continue
+                        ticket.update({
+                            key: diag_ticket[key] for key in _DIAGNOSTICS_RESULT_KEYS if key in diag_ticket
+                        })
+
+                    processed_tickets = categorized_tickets
 
             # End timer
-            self.stats['end_time'] = time.time()
+            self.stats['end_time'] = time.perf_counter()
 
             # Generate output based on analysis type
             output = self.generate_output(processed_tickets)
 
-            # Save output (may create multiple files for "both" mode)
-            output_filename = self.save_output(output)
+            # Save output (may create multiple files for "both" mode) in a worker
+            # thread, so the disk writes overlap with rendering the summary
+            filenames = self.get_output_filenames()
+            save_task = asyncio.create_task(
+                asyncio.to_thread(self.save_output, output, filenames=filenames)
+            )
 
-            # Display summary
-            self.display_summary(output_filename)
+            # Display summary, then confirm the output only once it is on disk
+            self.display_summary()
+            await save_task
+            self.display_output_saved(", ".join(filenames))
 
         except FileNotFoundError as e:
             self.console.print(f"[red]Error:[/red] {e}")
@@ -975,6 +1061,11 @@ class TicketSummarizer:
             self.logger.exception("Unexpected error occurred")
             self.console.print(f"[red]Unexpected error:[/red] {e}")
             sys.exit(1)
+        finally:
+            # Release the fetcher's pooled Zendesk connections and the LLM
+            # clients' provider-side resources (Gemini prompt caches)
+            await self.fetcher.close()
+            await LLMProviderFactory.close_all()
 
 
 def main():
@@ -1030,11 +1121,18 @@ Examples:
     args = parser.parse_args()
 
     # Create and run summarizer with specified analysis type and model provider
-    summarizer = TicketSummarizer(
-        analysis_type=args.analysis_type,
-        model_provider=args.model_provider
-    )
-    asyncio.run(summarizer.run(args.input))
+    try:
+        summarizer = TicketSummarizer(
+            analysis_type=args.analysis_type,
+            model_provider=args.model_provider
+        )
+    except ValueError as e:
+        Console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    if uvloop is not None:
+        uvloop.run(summarizer.run(args.input))
+    else:
+        asyncio.run(summarizer.run(args.input))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+"""
+On-disk cache for Zendesk API responses.
+
+Stores raw response bodies together with their ETag / Last-Modified headers in a
+local SQLite database, so repeated runs over overlapping CSVs can:
+- Send a conditional GET (If-None-Match / If-Modified-Since) and reuse the cached
+  body on HTTP 304 Not Modified
+- Reuse a ticket's comment pages without a request while its updated_at is unchanged
+
+Writes are batched: the database runs in WAL mode with synchronous=NORMAL and
+pending writes are committed once, in close().
+"""
+
+import os
+import sqlite3
+import time
+import logging
+from typing import Dict, NamedTuple, Optional
+
+import config
+
+
+class CachedResponse(NamedTuple):
+    """A cached Zendesk response body with its validators."""
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache keyed by request identity.
+
+    Keys used by the fetcher:
+    - "t:{ticket_id}"          → single ticket payload
+    - "c:{ticket_id}:{page}"   → one page of ticket comments
+    - "u:{ticket_id}"          → ticket updated_at the cached comment pages belong to
+    """
+
+    def __init__(self, path: str = config.ZENDESK_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite cache file
+        """
+        self.logger = logging.getLogger("ticket_summarizer.response_cache")
+
+        cache_dir = os.path.dirname(path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+            "last_modified TEXT, stored_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+        self.logger.debug("Opened Zendesk response cache at %s", path)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedResponse, or None if the key isn't cached
+        """
+        row = self.connection.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,)
+        ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Store (or replace) a response body and its validators.
+
+        Args:
+            key: Cache key
+            body: Raw response body
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, stored_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, body, etag, last_modified, time.time())
+        )
+
+    def touch(self, key: str) -> None:
+        """
+        Mark a cached entry as revalidated now (after an HTTP 304).
+
+        Args:
+            key: Cache key
+        """
+        self.connection.execute(
+            "UPDATE responses SET stored_at = ? WHERE key = ?",
+            (time.time(), key)
+        )
+
+    @staticmethod
+    def is_fresh(entry: CachedResponse, ttl_seconds: float) -> bool:
+        """
+        Check whether a cached entry can be used without revalidation.
+
+        Args:
+            entry: Cached response
+            ttl_seconds: Maximum age in seconds
+
+        Returns:
+            True if the entry is younger than ttl_seconds
+        """
+        return (time.time() - entry.stored_at) < ttl_seconds
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """
+        Build conditional GET headers for a cached entry.
+
+        Args:
+            entry: Cached response (or None)
+
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since headers when available
+        """
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def purge(self, max_age_seconds: float) -> int:
+        """
+        Delete entries older than max_age_seconds.
+
+        Args:
+            max_age_seconds: Maximum age in seconds
+
+        Returns:
+            Number of entries deleted
+        """
+        cursor = self.connection.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (time.time() - max_age_seconds,)
+        )
+        self.connection.commit()
+        if cursor.rowcount:
+            self.logger.debug("Purged %d expired cache entries", cursor.rowcount)
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Commit pending writes and close the cache database."""
+        self.connection.commit()
+        self.connection.close()
@@ -9,7 +9,7 @@ Implements rate limiting, retry logic, and response parsing.
 import asyncio
 import logging
 import re
-from typing import Dict, List, Optional, Callable
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import config
 import utils
@@ -140,7 +140,7 @@ class GeminiSynthesizer:
 
         except Exception as e:
             self.logger.error(f"Error parsing LLM response: {e}")
-            self.logger.debug(f"Raw response: {response_text[:500]}...")
+            self.logger.debug("Raw response: %.500s...", response_text)
 
         return synthesis
 
@@ -161,39 +161,35 @@ class GeminiSynthesizer:
         ticket_id = ticket_data.get('ticket_id', 'unknown')
 
         async with self.semaphore:
-            self.logger.debug(f"Synthesizing ticket {ticket_id}")
+            self.logger.debug("Synthesizing ticket %s", ticket_id)
 
             try:
                 # Format the prompt
                 prompt = self.format_prompt(ticket_data)
 
-                # Call LLM API (via provider abstraction, synchronous but wrapped in async)
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.llm_client.generate_content(prompt)
-                )
+                # Call LLM API (via provider abstraction, native async - no executor thread)
+                response = await self.llm_client.generate_content_async(prompt)
 
                 # Extract response text
                 if not response or not response.text:
                     raise utils.GeminiAPIError(f"Empty response from LLM for ticket {ticket_id}")
 
                 response_text = response.text
-                self.logger.debug(f"Received response for ticket {ticket_id}")
+                self.logger.debug("Received response for ticket %s", ticket_id)
 
                 # Parse the response
                 synthesis = self.parse_response(response_text)
 
+                # Only a fully parsed response is worth replaying from the cache
+                if all(synthesis.values()):
+                    self.llm_client.cache_response(prompt, response)
+
                 # Add to ticket data
                 result = ticket_data.copy()
                 result["synthesis"] = synthesis
 
                 self.logger.info(f"Successfully synthesized ticket {ticket_id}")
 
-                # Add delay to respect free tier rate limits
-                if config.GEMINI_REQUEST_DELAY > 0:
-                    await asyncio.sleep(config.GEMINI_REQUEST_DELAY)
-
                 return result
 
             except Exception as e:
@@ -209,6 +205,9 @@ class GeminiSynthesizer:
         """
         Synthesize multiple tickets in parallel with rate limiting.
 
+        Thin wrapper around synthesize_stream() for callers that already hold
+        every ticket (the CLI pipeline streams tickets in from the fetcher).
+
         Args:
             tickets: List of ticket dictionaries (successfully fetched)
             progress_callback: Optional callback function for progress updates
@@ -217,27 +216,89 @@ class GeminiSynthesizer:
             List of ticket dictionaries with synthesis results
         """
         self.logger.info(f"Starting to synthesize {len(tickets)} tickets")
-        results = []
 
-        # Filter out failed tickets (only synthesize successful fetches)
-        tickets_to_synthesize = [
-            t for t in tickets
-            if t.get('processing_status') == 'success'
-        ]
+        async def iterate_tickets() -> AsyncIterator[Dict]:
+            for ticket in tickets:
+                yield ticket
+
+        return await self.synthesize_stream(iterate_tickets(), progress_callback)
+
+    async def synthesize_stream(
+        self,
+        tickets: AsyncIterator[Dict],
+        progress_callback: Optional[Callable] = None,
+        order_key: Optional[Callable[[Dict], Any]] = None
+    ) -> List[Dict]:
+        """
+        Synthesize tickets as they arrive from an async iterator.
+
+        Each successfully fetched ticket is scheduled as soon as it is yielded (e.g. by
+        ZendeskFetcher.iter_tickets), so synthesis overlaps with the remaining fetches
+        instead of waiting for the whole fetch phase.
+
+        Args:
+            tickets: Async iterator of ticket dictionaries (successful and failed fetches)
+            progress_callback: Optional callback function for progress updates
+            order_key: Optional sort key restoring input order (tickets arrive in completion order)
+
+        Returns:
+            List of ticket dictionaries with synthesis results, same shape as synthesize_multiple()
+        """
+        tickets_to_synthesize = []
+        failed_fetches = []
+        tasks = []
+
+        try:
+            async for ticket in tickets:
+                if ticket.get('processing_status') == 'success':
+                    tickets_to_synthesize.append(ticket)
+                    tasks.append(asyncio.ensure_future(
+                        self._synthesize_with_progress(ticket, progress_callback)
+                    ))
+                else:
+                    failed_fetches.append(ticket)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         self.logger.info(
             f"Synthesizing {len(tickets_to_synthesize)} successfully fetched tickets"
         )
 
-        # Create tasks for parallel execution
-        tasks = []
-        for ticket in tickets_to_synthesize:
-            task = self._synthesize_with_progress(ticket, progress_callback)
-            tasks.append(task)
-
         # Execute all tasks and gather results
         synthesized_results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        if order_key is not None:
+            ordered = sorted(
+                range(len(tickets_to_synthesize)),
+                key=lambda i: order_key(tickets_to_synthesize[i])
+            )
+            tickets_to_synthesize = [tickets_to_synthesize[i] for i in ordered]
+            synthesized_results = [synthesized_results[i] for i in ordered]
+            failed_fetches.sort(key=order_key)
+
+        return self._collect_results(tickets_to_synthesize, synthesized_results, failed_fetches)
+
+    def _collect_results(
+        self,
+        tickets_to_synthesize: List[Dict],
+        synthesized_results: List[Any],
+        failed_fetches: List[Dict]
+    ) -> List[Dict]:
+        """
+        Pair gathered synthesis results with their tickets.
+
+        Args:
+            tickets_to_synthesize: Tickets that were sent for synthesis
+            synthesized_results: gather(return_exceptions=True) results, same order
+            failed_fetches: Tickets skipped because their fetch failed
+
+        Returns:
+            Synthesized (or synthesis_failed) tickets, followed by the failed fetches
+        """
+        results = []
+
         # Process results
         for i, result in enumerate(synthesized_results):
             if isinstance(result, Exception):
@@ -256,10 +317,6 @@ class GeminiSynthesizer:
                 results.append(result)
 
         # Add back tickets that were skipped (failed fetches)
-        failed_fetches = [
-            t for t in tickets
-            if t.get('processing_status') != 'success'
-        ]
         results.extend(failed_fetches)
 
         self.logger.info(f"Completed synthesis of {len(results)} tickets")
@@ -5,10 +5,13 @@ Includes logging, timezone conversion, HTML stripping, and retry logic.
 
 import os
 import logging
+import random
+import re
 import pytz
 import html2text
 from datetime import datetime
-from functools import wraps
+from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
 from typing import Optional
 from bs4 import BeautifulSoup
 import time
@@ -17,18 +20,37 @@ import asyncio
 import config
 
 
+logger = logging.getLogger("ticket_summarizer")
+
+
 # ============================================================================
 # CUSTOM EXCEPTIONS
 # ============================================================================
 
 class ZendeskAPIError(Exception):
     """Raised when Zendesk API calls fail."""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Seconds the server asked us to wait (HTTP 429 Retry-After)
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class GeminiAPIError(Exception):
     """Raised when Gemini API calls fail."""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Seconds the provider asked us to wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class TicketNotFoundError(Exception):
@@ -44,12 +66,19 @@ def setup_logger(name: str = "ticket_summarizer") -> logging.Logger:
     """
     Set up structured logging with both console and file handlers.
 
+    Idempotent: repeat calls for an already-configured logger return it as-is
+    instead of opening another log file handle.
+
     Args:
         name: Logger name
 
     Returns:
         Configured logger instance
     """
+    logger = logging.getLogger(name)
+    if getattr(logger, "_ticket_summarizer_configured", False):
+        return logger
+
     # Create logs directory if it doesn't exist
     if not os.path.exists(config.LOG_DIR):
         os.makedirs(config.LOG_DIR)
@@ -58,8 +87,7 @@ def setup_logger(name: str = "ticket_summarizer") -> logging.Logger:
     log_filename = f"app_{datetime.now().strftime('%Y%m%d')}.log"
     log_filepath = os.path.join(config.LOG_DIR, log_filename)
 
-    # Create logger
-    logger = logging.getLogger(name)
+    # Configure logger
     logger.setLevel(logging.DEBUG)
 
     # Remove existing handlers to avoid duplicates
@@ -83,6 +111,7 @@ def setup_logger(name: str = "ticket_summarizer") -> logging.Logger:
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
+    logger._ticket_summarizer_configured = True
     return logger
 
 
@@ -90,10 +119,14 @@ def setup_logger(name: str = "ticket_summarizer") -> logging.Logger:
 # TIMEZONE CONVERSION
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def convert_to_ist(utc_timestamp: str) -> str:
     """
     Convert UTC timestamp to IST (Indian Standard Time).
 
+    Memoized: the conversion is pure, and ticket/comment timestamps repeat
+    across a batch (and across cached re-runs).
+
     Args:
         utc_timestamp: UTC timestamp string (ISO 8601 format)
 
@@ -118,7 +151,6 @@ def convert_to_ist(utc_timestamp: str) -> str:
 
         return dt_ist.isoformat()
     except Exception as e:
-        logger = logging.getLogger("ticket_summarizer")
         logger.warning(f"Failed to convert timestamp '{utc_timestamp}' to IST: {e}")
         return utc_timestamp  # Return original if conversion fails
 
@@ -177,7 +209,6 @@ def strip_html(text: Optional[str]) -> str:
 
         return '\n'.join(lines)
     except Exception as e:
-        logger = logging.getLogger("ticket_summarizer")
         logger.warning(f"Failed to strip HTML from text: {e}")
         return text  # Return original if stripping fails
 
@@ -191,6 +222,9 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
     """
     Decorator to retry a function on failure with exponential backoff.
 
+    A random jitter of up to `delay` seconds is added to each wait so that
+    concurrent callers failing together don't retry in lockstep.
+
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
@@ -201,7 +235,6 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
     def decorator(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            logger = logging.getLogger("ticket_summarizer")
             last_exception = None
 
             for attempt in range(max_retries + 1):
@@ -210,10 +243,12 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries:
-                        wait_time = delay * (2 ** attempt)  # Exponential backoff
+                        # Exponential backoff with jitter, never shorter than a server Retry-After
+                        wait_time = delay * (2 ** attempt) + random.uniform(0, delay)
+                        wait_time = max(wait_time, getattr(e, 'retry_after', None) or 0)
                         logger.warning(
                             f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
-                            f"Retrying in {wait_time}s..."
+                            f"Retrying in {wait_time:.1f}s..."
                         )
                         await asyncio.sleep(wait_time)
                     else:
@@ -225,7 +260,6 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            logger = logging.getLogger("ticket_summarizer")
             last_exception = None
 
             for attempt in range(max_retries + 1):
@@ -234,10 +268,12 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries:
-                        wait_time = delay * (2 ** attempt)  # Exponential backoff
+                        # Exponential backoff with jitter, never shorter than a server Retry-After
+                        wait_time = delay * (2 ** attempt) + random.uniform(0, delay)
+                        wait_time = max(wait_time, getattr(e, 'retry_after', None) or 0)
                         logger.warning(
                             f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
-                            f"Retrying in {wait_time}s..."
+                            f"Retrying in {wait_time:.1f}s..."
                         )
                         time.sleep(wait_time)
                     else:
@@ -256,6 +292,186 @@ def retry_on_failure(max_retries: int = config.MAX_RETRIES,
     return decorator
 
 
+# ============================================================================
+# ADAPTIVE CONCURRENCY
+# ============================================================================
+
+_RATE_LIMIT_PATTERN = re.compile(r"\b429\b|rate.?limit|resource.?exhausted|too many requests", re.IGNORECASE)
+_RETRY_DELAY_PATTERN = re.compile(r"retry.?(?:delay|after)\W+(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an exception looks like a provider rate-limit response.
+
+    Both Gemini (RESOURCE_EXHAUSTED) and Azure OpenAI (429 Too Many Requests)
+    errors end up wrapped in GeminiAPIError, so classification is message-based.
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        True if the error indicates throttling, False otherwise
+    """
+    return bool(_RATE_LIMIT_PATTERN.search(str(error)))
+
+
+def rate_limit_retry_after(error: Exception) -> float:
+    """
+    Get how long to wait after a provider rate-limit error.
+
+    Uses the delay the provider named (Gemini retryDelay / Azure Retry-After
+    in the error message) when present, else LLM_DEFAULT_RETRY_AFTER_SECONDS.
+
+    Args:
+        error: Rate-limit exception raised by an LLM call
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    match = _RETRY_DELAY_PATTERN.search(str(error))
+    return float(match.group(1)) if match else float(config.LLM_DEFAULT_RETRY_AFTER_SECONDS)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD (additive-increase, multiplicative-decrease) concurrency limiter.
+
+    Replaces a static asyncio.Semaphore: every successful call raises the limit
+    by `increase_step` up to `ceiling`, and every rate-limit error halves it
+    (never below 1). Admission is gated on the integer part of the current limit.
+
+    Usage:
+        limiter = AdaptiveLimiter(initial_limit=1, ceiling=5)
+        async with limiter.slot():
+            ...
+        limiter.record_success()  # or limiter.record_rate_limit()
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        ceiling: int,
+        increase_step: float = config.LLM_ADAPTIVE_INCREASE_STEP,
+        decrease_factor: float = config.LLM_ADAPTIVE_DECREASE_FACTOR
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent slots
+            ceiling: Maximum number of concurrent slots
+            increase_step: Amount added to the limit after each success
+            decrease_factor: Multiplier applied to the limit after a rate-limit error
+        """
+        self.ceiling = max(1, ceiling)
+        self.current_limit = float(min(max(1, initial_limit), self.ceiling))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._inflight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Acquire a concurrency slot, waiting while the current limit is saturated."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._inflight < int(self.current_limit))
+            self._inflight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._inflight -= 1
+                self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additively increase the limit after a successful call."""
+        self.current_limit = min(self.ceiling, self.current_limit + self.increase_step)
+
+    def record_rate_limit(self) -> None:
+        """Multiplicatively decrease the limit after a rate-limit error."""
+        self.current_limit = max(1.0, self.current_limit * self.decrease_factor)
+        logger.warning(f"Rate limit hit - reducing LLM concurrency to {int(self.current_limit)}")
+
+
+class TokenBucket:
+    """
+    Token-bucket request rate limiter with server feedback.
+
+    Tokens refill continuously at `rate_per_minute / 60` per second up to
+    `burst` (default `rate_per_minute`). The bucket is tightened from rate-limit
+    headers: when the server reports few remaining requests the available
+    tokens are capped to that number, and a 429 pauses every caller until
+    Retry-After elapses.
+
+    Usage:
+        bucket = TokenBucket(rate_per_minute=700)
+        await bucket.acquire()
+        ...
+        bucket.observe(remaining=..., retry_after=...)
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: int,
+        low_watermark: int = config.ZENDESK_RATE_LIMIT_LOW_WATERMARK,
+        burst: Optional[int] = None
+    ):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate_per_minute: Sustained request rate
+            low_watermark: Remaining-quota level below which tokens are capped
+            burst: Bucket capacity (defaults to rate_per_minute). Use a small burst
+                   when the server sends no rate-limit headers to tighten it.
+        """
+        self.capacity = float(max(1, burst if burst is not None else rate_per_minute))
+        self.fill_rate = max(1, rate_per_minute) / 60.0
+        self.low_watermark = low_watermark
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.fill_rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available (and any Retry-After pause has ended), then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+    def observe(self, remaining: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Adjust the bucket from server rate-limit feedback.
+
+        Args:
+            remaining: Value of the X-Rate-Limit-Remaining header, if present
+            retry_after: Seconds from a 429 Retry-After header, if present
+        """
+        if retry_after:
+            self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+            logger.warning("Rate limited by server - pausing requests for %.0fs", retry_after)
+
+        if remaining is not None and remaining < self.low_watermark:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, float(remaining))
+
+
 # ============================================================================
 # FORMATTING UTILITIES
 # ============================================================================
@@ -429,10 +645,10 @@ def normalize_diagnostics_field(raw_value: Optional[str]) -> str:
     else:
         # For any other value (NA, null, unknown, etc.), return "Not Applicable"
         # Log a debug message (not warning) since "NA" and empty values are expected
-        logger = logging.getLogger("ticket_summarizer")
         logger.debug(
-            f"Diagnostics custom field value '{raw_value}' is not 'diagnostic_yes' or 'diagnostic_no'. "
-            f"Marking as 'Not Applicable'."
+            "Diagnostics custom field value '%s' is not 'diagnostic_yes' or 'diagnostic_no'. "
+            "Marking as 'Not Applicable'.",
+            raw_value
         )
         return "Not Applicable"
 
@@ -566,6 +782,26 @@ def determine_escalation_status(cross_team_value: Optional[str], jira_url: Optio
     }
 
 
+def is_escalated(ticket: dict) -> bool:
+    """
+    Check whether a processed ticket was escalated to engineering (Phase 5).
+
+    Reads custom_fields.escalation.is_escalated without allocating empty
+    fallback dicts for tickets that have no custom fields.
+
+    Args:
+        ticket: Ticket dictionary (as produced by the fetcher)
+
+    Returns:
+        True if the ticket's escalation status is set
+    """
+    custom_fields = ticket.get("custom_fields")
+    if not custom_fields:
+        return False
+    escalation = custom_fields.get("escalation")
+    return bool(escalation and escalation.get("is_escalated"))
+
+
 def validate_diagnostics_assessment(assessment: str) -> bool:
     """
     Validate diagnostics assessment value against allowed values.